@@ -0,0 +1,116 @@
+import dbm # Simple persistent key-value store from the standard library
+import os
+import numpy as np
+from cache_keys import content_key
+
+class EmbeddingCache:
+    """
+    Persists sentence embeddings on disk so that unchanged slide summaries
+    are never re-encoded across runs.
+
+    Each vector is stored as raw float32 bytes in a dbm database, keyed by a
+    digest of the model name and the text it was computed from.
+    """
+    def __init__(self, model_name, db_path=os.path.join("text_output", "emb_cache.db")):
+        """
+        Initializes the EmbeddingCache and opens (or creates) the database file.
+
+        Args:
+            model_name (str): The name of the embedding model. Part of every key,
+                              so switching models never returns stale vectors.
+            db_path (str): The path to the dbm database file
+                           (default: "text_output/emb_cache.db").
+        """
+        self.model_name = model_name
+        self.db_path = db_path
+
+        # Ensure the directory holding the database exists
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._db = dbm.open(self.db_path, "c")
+
+    def _key(self, text):
+        """
+        Builds the cache key for a piece of text.
+
+        Args:
+            text (str): The text that was (or will be) embedded.
+
+        Returns:
+            bytes: The digest of the model name and text.
+        """
+        return content_key(self.model_name, text)
+
+    def get(self, text):
+        """
+        Looks up the cached embedding for a piece of text.
+
+        Args:
+            text (str): The text to look up.
+
+        Returns:
+            numpy.ndarray or None: The cached float32 vector, or None on a cache miss.
+        """
+        value = self._db.get(self._key(text))
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype="float32")
+
+    def put(self, text, vector):
+        """
+        Stores the embedding for a piece of text.
+
+        Args:
+            text (str): The text the vector was computed from.
+            vector (numpy.ndarray): The embedding vector.
+        """
+        self._db[self._key(text)] = np.asarray(vector, dtype="float32").tobytes()
+
+    def encode(self, texts, encode_fn):
+        """
+        Returns embeddings for all texts, computing them only for cache misses.
+        Newly computed vectors are written back to the cache.
+
+        Args:
+            texts (list): The texts to embed.
+            encode_fn (callable): Takes a list of texts and returns their embeddings
+                                  as a (len(texts), d) float32 array.
+
+        Returns:
+            numpy.ndarray: A (len(texts), d) float32 array in the same order as `texts`.
+        """
+        vectors = [self.get(text) for text in texts]
+        miss_positions = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if miss_positions:
+            print(f"🧮 Encoding {len(miss_positions)} of {len(texts)} texts (cache misses).")
+            miss_vecs = encode_fn([texts[i] for i in miss_positions])
+            for i, vector in zip(miss_positions, miss_vecs):
+                self.put(texts[i], vector)
+                vectors[i] = vector
+            self.sync()
+
+        if not vectors:
+            return np.empty((0, 0), dtype="float32")
+
+        # Assemble the final matrix in the original order
+        embeddings = np.empty((len(vectors), len(vectors[0])), dtype="float32")
+        for i, vector in enumerate(vectors):
+            embeddings[i] = vector
+        return embeddings
+
+    def sync(self):
+        """
+        Flushes pending writes to disk, if the underlying dbm backend supports it.
+        """
+        sync = getattr(self._db, "sync", None)
+        if sync:
+            sync()
+
+    def close(self):
+        """
+        Closes the underlying database.
+        """
+        self._db.close()
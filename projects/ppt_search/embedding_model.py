@@ -0,0 +1,43 @@
+import functools
+import threading
+
+# 'all-MiniLM-L6-v2' is a good balance of efficiency and accuracy.
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Serializes the first load, so concurrent callers never load the same model twice
+_load_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load(model_name):
+    """
+    Internal helper that loads a SentenceTransformer model; memoized per model name.
+
+    Args:
+        model_name (str): The name of the embedding model.
+
+    Returns:
+        SentenceTransformer: The loaded embedding model.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer # For generating text embeddings
+
+    # Pick the device once so every encode call runs on it without further checks
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    return SentenceTransformer(model_name, device=device)
+
+
+def load_embedding_model(model_name=EMBEDDING_MODEL_NAME):
+    """
+    Returns the SentenceTransformer model with the given name, loading it on the
+    first call only. The summarizer's semantic cache and the search converter
+    share this loader, so a run that uses both loads the model once.
+
+    Args:
+        model_name (str): The name of the embedding model (default: 'all-MiniLM-L6-v2').
+
+    Returns:
+        SentenceTransformer: The loaded embedding model.
+    """
+    with _load_lock:
+        return _load(model_name)
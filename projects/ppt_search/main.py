@@ -1,7 +1,8 @@
+import argparse
 import os
-from summary import SlideSummarizer
+from summary import SlideSummarizer, iter_pptx_files
 from read_json import JSONManager
-from ppt_to_file import PPTConverterAndSearch
+from ppt_to_file import PPTConverterAndSearch, SearchCorpus
 
 def ensure_base_directories(directories):
     """
@@ -16,6 +17,14 @@ def main():
     """
     Main function to orchestrate the PowerPoint processing workflow.
     """
+    parser = argparse.ArgumentParser(description="Summarize PowerPoint decks and search them semantically.")
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="Display matching slides on screen in addition to saving them to 'output_images'.",
+    )
+    args = parser.parse_args()
+
     # --- Configuration ---
     PPTX_SOURCE_FOLDER = "pptbase"
     PDF_OUTPUT_FOLDER = "pdf_output"
@@ -32,25 +41,17 @@ def main():
     
     # --- Step 1: Convert PPTX files to PDF ---
     print("\n--- Starting PowerPoint to PDF Conversion ---")
-    converter = PPTConverterAndSearch() 
+    converter = PPTConverterAndSearch(interactive=args.interactive)
     
-    pptx_files_found = False
-    for file in os.listdir(PPTX_SOURCE_FOLDER):
-        if file.endswith(".pptx"):
-            pptx_files_found = True
-            pdf_name = file.replace(".pptx", ".pdf")
-            
-            # Convert both input and output paths to absolute paths
-            input_pptx_path = os.path.abspath(os.path.join(PPTX_SOURCE_FOLDER, file))
-            output_pdf_path = os.path.abspath(os.path.join(PDF_OUTPUT_FOLDER, pdf_name))
-
-            print(f"Converting '{file}' to PDF...")
-            converter.convert_pptx_to_pdf(input_pptx_path, output_pdf_path)
-    
-    if not pptx_files_found:
+    pptx_paths = iter_pptx_files(PPTX_SOURCE_FOLDER)
+    if not pptx_paths:
         print(f"No .pptx files found in '{PPTX_SOURCE_FOLDER}'. Skipping PDF conversion.")
         print("Ensure your PowerPoint files are in the specified folder.")
         return
+
+    # Convert all files in one batch, using absolute paths for both input and output
+    input_pptx_paths = [os.path.abspath(path) for path in pptx_paths]
+    converter.convert_all_to_pdf(input_pptx_paths, os.path.abspath(PDF_OUTPUT_FOLDER))
     
     # --- Step 2: Summarize PPTX slide content using an LLM ---
     print("\n--- Starting Slide Summarization ---")
@@ -72,12 +73,9 @@ def main():
         json_manager = JSONManager(filename=SUMMARIES_JSON_FILE)
         loaded_summaries = json_manager.get_data()
 
-        all_slide_map_for_search = {}
-        for pptx_filename, slides_list in loaded_summaries.items():
-            for i, summary_text in enumerate(slides_list):
-                all_slide_map_for_search[(pptx_filename, i)] = summary_text
+        search_corpus = SearchCorpus.from_summaries(loaded_summaries)
 
-        if not all_slide_map_for_search:
+        if not len(search_corpus):
             print("No slide summaries available for search. Please check the summary generation process.")
             return
 
@@ -86,7 +84,7 @@ def main():
         
         # Reuse the existing converter object for searching
         converter.search_with_rag_pipeline(
-            all_slide_map=all_slide_map_for_search, 
+            corpus=search_corpus, 
             query=user_query, 
             top_k=3
         )
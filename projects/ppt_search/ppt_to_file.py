@@ -1,11 +1,57 @@
-import comtypes.client
+import atexit # For closing cached PDF documents on exit
 import fitz  # PyMuPDF for PDF manipulation
-import io
+import json
+import numpy as np
 from PIL import Image # Pillow for image processing
 import os # For interacting with the operating system (e.g., file paths, directory creation)
-import matplotlib.pyplot as plt # For displaying images
-from sentence_transformers import SentenceTransformer # For generating text embeddings
-import faiss # For efficient similarity search of embeddings
+import pathlib
+import shutil # For locating the LibreOffice executable
+import subprocess # For running LibreOffice in headless mode
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed # For parallel PDF conversion
+from dataclasses import dataclass
+from functools import cached_property # For lazily loading the embedding model once
+# matplotlib, torch, sentence_transformers and faiss are heavy to import,
+# so they are imported inside the methods that use them.
+from cache_keys import new_hasher
+from embedding_cache import EmbeddingCache # Persistent on-disk cache of slide embeddings
+from embedding_model import EMBEDDING_MODEL_NAME, load_embedding_model # Shared, lazily loaded model
+
+@dataclass
+class SearchCorpus:
+    """
+    Slide summaries laid out as parallel arrays (one entry per slide), so the
+    search index can be built and its results resolved by plain positional indexing.
+    """
+    __slots__ = ("filenames", "slide_nums", "texts")
+
+    filenames: np.ndarray # Object array of PowerPoint filenames
+    slide_nums: np.ndarray # int32 array of 0-based slide indices
+    texts: list # Summarized text content of each slide
+
+    @classmethod
+    def from_summaries(cls, summaries):
+        """
+        Builds a corpus from the summaries produced by SlideSummarizer in a single pass.
+
+        Args:
+            summaries (dict): Filenames mapped to lists of slide summaries.
+
+        Returns:
+            SearchCorpus: The corpus, with slides in file then slide order.
+        """
+        filenames, slide_nums, texts = [], [], []
+        for pptx_filename, slides_list in summaries.items():
+            for i, summary_text in enumerate(slides_list):
+                filenames.append(pptx_filename)
+                slide_nums.append(i)
+                texts.append(summary_text)
+        return cls(np.array(filenames, dtype=object), np.array(slide_nums, dtype=np.int32), texts)
+
+    def __len__(self):
+        return len(self.texts)
+
 
 class PPTConverterAndSearch:
     """
@@ -13,55 +59,240 @@ class PPTConverterAndSearch:
     displaying PDF pages, and performing semantic search on slide content
     using a RAG pipeline.
     """
-    def __init__(self):
+    EMBEDDING_MODEL_NAME = EMBEDDING_MODEL_NAME
+    # Above this many slides embeddings are stored as 8-bit scalar-quantized codes,
+    # cutting index memory (and the bytes read per search) by 4x.
+    QUANTIZE_MIN_SLIDES = 1000
+    # Above this many slides an approximate HNSW graph index is used instead of
+    # an exact flat scan, keeping search latency sub-linear in the corpus size.
+    HNSW_MIN_SLIDES = 5000
+    # Above this many texts, CPU encoding is sharded across worker processes
+    MULTI_PROCESS_MIN_TEXTS = 1000
+    # Where the built search index and the fingerprint of its corpus are persisted
+    INDEX_PATH = os.path.join("text_output", "slides.faiss")
+    INDEX_META_PATH = os.path.join("text_output", "slides.meta.json")
+    # Per-file time budget for PDF conversion
+    CONVERSION_TIMEOUT_SECONDS = 120
+
+    def __init__(self, interactive=False, image_output_folder="output_images"):
         """
         Initializes the PPTConverterAndSearch class.
         Sets up directories for PDF and image outputs.
+
+        Args:
+            interactive (bool): If True, matched slide pages are also shown on screen
+                                with Matplotlib. Otherwise they are only saved as images.
+                                Defaults to False.
+            image_output_folder (str): The directory where matched slide pages are saved
+                                       (default: "output_images").
         """
+        self.interactive = interactive
+        self.image_output_folder = image_output_folder
+
         # Ensure output directories exist
         os.makedirs("pdf_output", exist_ok=True)
-        os.makedirs("output_images", exist_ok=True)
-        print("📁 'pdf_output' and 'output_images' directories ensured.")
+        os.makedirs(self.image_output_folder, exist_ok=True)
+        print(f"📁 'pdf_output' and '{self.image_output_folder}' directories ensured.")
+
+        # Cache of built FAISS indexes keyed by a fingerprint of the corpus contents,
+        # so repeated queries over the same summaries skip re-encoding.
+        self._index_cache = {}
+
+        # Opened PDF documents keyed by path, so several matches from the same
+        # deck (or repeated queries) parse the PDF only once.
+        self._docs = {}
+        atexit.register(self._close_pdfs)
+
+    @cached_property
+    def model(self):
+        """
+        The SentenceTransformer model used for generating embeddings.
+        Loaded lazily on first access and reused for all subsequent queries; shared
+        with the summarizer's semantic cache when it has already loaded it.
+
+        Returns:
+            SentenceTransformer: The loaded embedding model.
+        """
+        return load_embedding_model(self.EMBEDDING_MODEL_NAME)
+
+    @cached_property
+    def embedding_cache(self):
+        """
+        The persistent embedding cache, opened on first access.
+
+        Returns:
+            EmbeddingCache: Cache of slide embeddings for the current model.
+        """
+        return EmbeddingCache(self.EMBEDDING_MODEL_NAME)
+
+    def convert_all_to_pdf(self, input_pptx_paths, output_folder="pdf_output"):
+        """
+        Converts a batch of PowerPoint presentations (.pptx) to PDF files named
+        after each presentation (e.g. 'deck.pptx' -> 'deck.pdf').
+
+        Uses headless LibreOffice when available, converting files in parallel.
+        On Windows without LibreOffice, falls back to one shared PowerPoint
+        COM session for the whole batch.
+
+        Args:
+            input_pptx_paths (list): Full paths to the input PowerPoint files.
+            output_folder (str): The directory where the PDF files will be saved.
+        """
+        if not input_pptx_paths:
+            return
+        os.makedirs(output_folder, exist_ok=True)
+
+        soffice = shutil.which("soffice") or shutil.which("libreoffice")
+        if soffice:
+            self._convert_with_libreoffice(soffice, input_pptx_paths, output_folder)
+        elif os.name == "nt":
+            self._convert_with_powerpoint(input_pptx_paths, output_folder)
+        else:
+            print("❌ LibreOffice ('soffice') not found on PATH. Install LibreOffice to convert PPTX files to PDF.")
 
     def convert_pptx_to_pdf(self, input_pptx_path, output_pdf_path):
         """
-        Converts a PowerPoint presentation (.pptx) to a PDF file.
-        It attempts to kill any running PowerPoint processes to prevent conflicts,
-        unhides all slides, and saves the presentation as a PDF.
+        Converts a single PowerPoint presentation (.pptx) to a PDF file.
 
         Args:
             input_pptx_path (str): The full path to the input PowerPoint file.
             output_pdf_path (str): The desired full path for the output PDF file.
         """
-        powerpoint = None # Initialize powerpoint object to None
+        output_folder = os.path.dirname(output_pdf_path) or "."
+        self.convert_all_to_pdf([input_pptx_path], output_folder)
+
+        # Both converters name the PDF after the input file; rename if a different name was requested
+        converted_pdf_path = os.path.join(output_folder, self._pdf_name(input_pptx_path))
+        if os.path.exists(converted_pdf_path) and os.path.abspath(converted_pdf_path) != os.path.abspath(output_pdf_path):
+            os.replace(converted_pdf_path, output_pdf_path)
+
+    def _convert_with_libreoffice(self, soffice, input_pptx_paths, output_folder):
+        """
+        Internal helper method to convert presentations with headless LibreOffice,
+        one process per file, running up to one conversion per CPU core in parallel.
+        Hidden slides are exported too, so PDF pages line up with the slides whose
+        text is extracted and summarized.
+
+        Args:
+            soffice (str): The path to the LibreOffice executable.
+            input_pptx_paths (list): Full paths to the input PowerPoint files.
+            output_folder (str): The directory where the PDF files will be saved.
+        """
+        max_workers = min(os.cpu_count() or 1, len(input_pptx_paths))
+        print(f"🔄 Converting {len(input_pptx_paths)} presentation(s) to PDF with LibreOffice "
+              f"({max_workers} in parallel)...")
+
+        # The per-thread profiles live in one temporary directory, removed once the pool has finished
+        profiles_dir = tempfile.mkdtemp(prefix="lo_profiles_")
         try:
-            print(f"🔄 Attempting to convert '{input_pptx_path}' to PDF...")
-            # Attempt to kill existing PowerPoint processes to ensure a clean start
-            # This is a brute-force method and might close other open PPT files.
-            os.system("taskkill /f /im POWERPNT.EXE 2>NUL") # 2>NUL suppresses error messages
+            # Each task only waits on its own soffice process, so threads are enough to run them in parallel
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._convert_one_with_libreoffice, soffice, input_pptx_path, output_folder, profiles_dir):
+                        input_pptx_path
+                    for input_pptx_path in input_pptx_paths
+                }
+                for future in as_completed(futures):
+                    input_pptx_path = futures[future]
+                    output_pdf_path = os.path.join(output_folder, self._pdf_name(input_pptx_path))
+                    error = future.result()
+                    if error is None:
+                        print(f"✅ PDF successfully saved with all slides: {output_pdf_path}")
+                    else:
+                        print(f"❌ Conversion error for '{input_pptx_path}': {error}")
+        finally:
+            try:
+                shutil.rmtree(profiles_dir)
+            except OSError as e:
+                # A lingering soffice process may still hold files; leftovers are harmless
+                print(f"⚠️ Could not remove LibreOffice profiles '{profiles_dir}': {e}")
+
+    def _convert_one_with_libreoffice(self, soffice, input_pptx_path, output_folder, profiles_dir):
+        """
+        Internal helper method to convert a single presentation with headless LibreOffice.
+        Concurrent LibreOffice processes sharing a user profile serialize on (or fail on)
+        the profile lock, so every worker thread uses its own profile directory.
+        A failed conversion is retried once to ride out transient rendering errors.
+        soffice often exits with code 0 when it cannot load a file, so a conversion
+        only succeeds if it produced a new PDF; any PDF from an earlier run is removed
+        first so it cannot hide a failure.
+
+        Args:
+            soffice (str): The path to the LibreOffice executable.
+            input_pptx_path (str): The full path to the input PowerPoint file.
+            output_folder (str): The directory where the PDF file will be saved.
+            profiles_dir (str): The temporary directory holding the per-thread profiles.
+
+        Returns:
+            str or None: An error message if the conversion failed, otherwise None.
+        """
+        # Reused by every file this thread converts, so the profile is only initialized once
+        profile_dir = os.path.join(profiles_dir, f"profile_{threading.get_ident()}")
+        command = [
+            soffice, "--headless",
+            f"-env:UserInstallation={pathlib.Path(profile_dir).as_uri()}",
+            "--convert-to", 'pdf:impress_pdf_Export:{"ExportHiddenSlides":{"type":"boolean","value":"true"}}',
+            "--outdir", output_folder,
+            input_pptx_path,
+        ]
+        output_pdf_path = os.path.join(output_folder, self._pdf_name(input_pptx_path))
+        try:
+            os.remove(output_pdf_path)
+        except FileNotFoundError:
+            pass
+
+        error = None
+        for _attempt in range(2):
+            try:
+                result = subprocess.run(command, check=True, capture_output=True, timeout=self.CONVERSION_TIMEOUT_SECONDS)
+                if os.path.exists(output_pdf_path):
+                    return None
+                error = result.stderr.decode(errors="replace").strip() or "LibreOffice exited without producing a PDF."
+            except subprocess.CalledProcessError as e:
+                error = e.stderr.decode(errors="replace").strip() or f"soffice exited with code {e.returncode}"
+            except subprocess.TimeoutExpired:
+                error = "LibreOffice conversion timed out."
+        return error
+
+    def _convert_with_powerpoint(self, input_pptx_paths, output_folder):
+        """
+        Internal helper method to convert all presentations using a single
+        PowerPoint COM application (Windows only). The application is started
+        once, reused for every file, and quit once at the end.
+
+        Args:
+            input_pptx_paths (list): Full paths to the input PowerPoint files.
+            output_folder (str): The directory where the PDF files will be saved.
+        """
+        import comtypes.client # Windows-only dependency, imported only when needed
 
+        powerpoint = None # Initialize powerpoint object to None
+        try:
             # Create a PowerPoint application object
             powerpoint = comtypes.client.CreateObject("PowerPoint.Application")
             powerpoint.Visible = 1
 
-            # Open the presentation. WithWindow=False prevents a visible window from popping up.
-            presentation = powerpoint.Presentations.Open(input_pptx_path, WithWindow=False)
+            for input_pptx_path in input_pptx_paths:
+                output_pdf_path = os.path.abspath(os.path.join(output_folder, self._pdf_name(input_pptx_path)))
+                try:
+                    print(f"🔄 Attempting to convert '{input_pptx_path}' to PDF...")
+                    # Open the presentation. WithWindow=False prevents a visible window from popping up.
+                    presentation = powerpoint.Presentations.Open(os.path.abspath(input_pptx_path), WithWindow=False)
 
-            # Unhide all slides to ensure they are included in the PDF export
-            for i in range(1, presentation.Slides.Count + 1):
-                presentation.Slides(i).SlideShowTransition.Hidden = False
+                    # Unhide all slides to ensure they are included in the PDF export
+                    for i in range(1, presentation.Slides.Count + 1):
+                        presentation.Slides(i).SlideShowTransition.Hidden = False
 
-            # Export the presentation to PDF format (FileFormat=32)
-            presentation.SaveAs(output_pdf_path, FileFormat=32)
-            
-            # Close the presentation and quit the PowerPoint application
-            presentation.Close()
-            powerpoint.Quit()
-            
-            print(f"✅ PDF successfully saved with all slides: {output_pdf_path}")
+                    # Export the presentation to PDF format (FileFormat=32)
+                    presentation.SaveAs(output_pdf_path, FileFormat=32)
+                    presentation.Close()
+
+                    print(f"✅ PDF successfully saved with all slides: {output_pdf_path}")
+                except Exception as e:
+                    print(f"❌ Conversion error for '{input_pptx_path}': {e}")
 
         except Exception as e:
-            print(f"❌ Conversion error for '{input_pptx_path}': {e}")
+            print(f"❌ Could not start PowerPoint: {e}")
         finally:
             # Ensure PowerPoint application is closed even if an error occurs
             if powerpoint:
@@ -70,9 +301,23 @@ class PPTConverterAndSearch:
                 except Exception as e:
                     print(f"Warning: Could not gracefully quit PowerPoint application: {e}")
 
+    @staticmethod
+    def _pdf_name(input_pptx_path):
+        """
+        Returns the PDF file name produced for a presentation (e.g. 'deck.pptx' -> 'deck.pdf').
+
+        Args:
+            input_pptx_path (str): The path to the PowerPoint file.
+
+        Returns:
+            str: The PDF file name.
+        """
+        return os.path.splitext(os.path.basename(input_pptx_path))[0] + ".pdf"
+
     def display_pdf_page(self, pdf_path, page_number):
         """
-        Displays a specific page from a PDF file as an image.
+        Renders a specific page from a PDF file as an image and saves it to the
+        image output folder. The page is also displayed when running interactively.
 
         Args:
             pdf_path (str): The full path to the PDF file.
@@ -83,8 +328,8 @@ class PPTConverterAndSearch:
                                      otherwise None.
         """
         try:
-            # Open the PDF document
-            doc = fitz.open(pdf_path)
+            # Open the PDF document (or reuse the already opened one)
+            doc = self._open_pdf(pdf_path)
             
             # Validate the page number
             if not (1 <= page_number <= len(doc)):
@@ -95,13 +340,20 @@ class PPTConverterAndSearch:
             page = doc.load_page(page_number - 1)
             
             # Get a pixmap (pixel map) of the page
-            pix = page.get_pixmap()
-            
-            # Convert the pixmap to a PIL Image object
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
+            pix = page.get_pixmap(dpi=100)
             
-            # Display the image using matplotlib
-            self._display_image(img)
+            # Wrap the raw pixmap samples in a PIL Image (no PNG encode/decode round-trip)
+            img = Image.frombytes("RGBA" if pix.alpha else "RGB", (pix.width, pix.height), pix.samples)
+
+            # Save the page with light compression, which is much faster than PNG's default
+            pdf_stem = os.path.splitext(os.path.basename(pdf_path))[0]
+            image_path = os.path.join(self.image_output_folder, f"{pdf_stem}_slide_{page_number}.png")
+            img.save(image_path, "PNG", optimize=False, compress_level=1)
+            print(f"🖼️ Saved slide image: {image_path}")
+
+            # Display the image using matplotlib only when running interactively
+            if self.interactive:
+                self._display_image(img)
             return img # Return the image object if needed elsewhere
         except fitz.FileDataError:
             print(f"❌ Error: The file '{pdf_path}' is not a valid PDF or is corrupted.")
@@ -110,64 +362,77 @@ class PPTConverterAndSearch:
             print(f"❌ Error displaying PDF page {page_number} from '{pdf_path}': {e}")
             return None
 
-    def search_with_rag_pipeline(self, all_slide_map, query="What am I looking for?", top_k=3):
+    def _open_pdf(self, pdf_path):
+        """
+        Internal helper method that returns an opened PDF document, opening
+        it only the first time a given path is requested.
+
+        Args:
+            pdf_path (str): The full path to the PDF file.
+
+        Returns:
+            fitz.Document: The opened PDF document.
+        """
+        doc = self._docs.get(pdf_path)
+        if doc is None:
+            doc = self._docs[pdf_path] = fitz.open(pdf_path)
+        return doc
+
+    def _close_pdfs(self):
+        """
+        Internal helper method to close all cached PDF documents.
+        """
+        for doc in self._docs.values():
+            doc.close()
+        self._docs.clear()
+
+    def search_with_rag_pipeline(self, corpus, query="What am I looking for?", top_k=3):
         """
         Performs a semantic search across summarized slide content using SentenceTransformers
         and FAISS. It finds the top_k most relevant slides based on the query.
 
         Args:
-            all_slide_map (dict): A dictionary where keys are (filename, slide_number) tuples
-                                  and values are the summarized text content of each slide.
+            corpus (SearchCorpus): The summarized text content of each slide, with the
+                                   filename and 0-based slide number it came from.
             query (str): The search query provided by the user.
             top_k (int): The number of top matching slides to retrieve and display.
         """
+        import faiss # For efficient similarity search of embeddings
+        import torch
+
         print(f"\n🔍 Performing semantic search for query: '{query}'")
         
-        # Load a pre-trained SentenceTransformer model for generating embeddings
-        # 'all-MiniLM-L6-v2' is a good balance of efficiency and accuracy.
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-
-        # Prepare keys and texts for embedding and indexing
-        # Keys are tuples: (original_pptx_filename, 0-based_slide_index)
-        keys = list(all_slide_map.keys())
-        # Texts are the summarized content of each slide
-        texts = list(all_slide_map.values())
-
-        if not texts:
-            print("⚠️ No slide content available for search. Please ensure `all_slide_map` is populated.")
+        if not len(corpus):
+            print("⚠️ No slide content available for search. Please ensure `corpus` is populated.")
             return
 
-        # Generate embeddings for all slide texts
-        # convert_to_tensor=True for GPU acceleration if available, then move to CPU and convert to NumPy
-        embeddings = model.encode(texts, convert_to_tensor=True).detach().cpu().numpy()
+        # Reuse a previously built (or persisted) index if the corpus has not changed
+        index = self._load_or_build_index(corpus)
 
-        # Get the dimensionality of the embeddings (vector dimension)
-        d = embeddings.shape[1]
-
-        # Create a FAISS index for efficient similarity search
-        # IndexFlatL2 uses Euclidean distance (L2 norm) for similarity.
-        index = faiss.IndexFlatL2(d)
-        
-        # Add the slide embeddings to the FAISS index
-        index.add(embeddings)
+        if isinstance(index, faiss.IndexHNSW):
+            # efSearch must be at least top_k to return top_k results
+            index.hnsw.efSearch = max(16, top_k)
 
         # Encode the query into an embedding
-        query_embedding = model.encode([query]).astype('float32')
+        with torch.inference_mode():
+            query_embedding = self.model.encode([query], convert_to_numpy=True, normalize_embeddings=True)
 
         # Search the FAISS index for the top_k closest matches to the query embedding
-        # D is distances, I is indices
+        # D is similarities, I is indices
         _, closest_indices = index.search(query_embedding, top_k)
 
+        # FAISS pads with -1 when there are fewer than top_k results
+        matches = closest_indices[0][closest_indices[0] >= 0]
+
         print("\n✨ Top Matches Found:")
-        # Iterate through the indices of the closest matches
-        for idx in closest_indices[0]:
-            # Retrieve the original filename and 0-based slide number using the index
-            original_pptx_filename, slide_num_zero_based = keys[idx]
-            
+        # Retrieve the original filename and 0-based slide number of every match by position
+        matched_filenames = corpus.filenames[matches]
+        matched_slide_nums = corpus.slide_nums[matches].tolist()
+        for original_pptx_filename, slide_num_zero_based in zip(matched_filenames, matched_slide_nums):
             # Construct the PDF path for the matched slide's presentation
             # Assuming PDFs are named the same as PPTXs but with .pdf extension,
             # and stored in 'pdf_output'
-            pdf_path = os.path.join("pdf_output", original_pptx_filename.replace(".pptx", ".pdf"))
+            pdf_path = os.path.join("pdf_output", self._pdf_name(original_pptx_filename))
             
             # Print the matching slide information
             print(f"> Found in: '{original_pptx_filename}' - Slide {slide_num_zero_based + 1}")
@@ -176,6 +441,180 @@ class PPTConverterAndSearch:
             self.display_pdf_page(pdf_path, slide_num_zero_based + 1)
             print("-" * 30) # Separator for readability
 
+    def _load_or_build_index(self, corpus):
+        """
+        Internal helper method that returns a FAISS index over the slide summaries.
+        The index is looked up in memory first, then on disk, and only built
+        (and persisted) when the corpus has changed. The i-th vector in the index
+        belongs to the i-th slide of the corpus.
+
+        Args:
+            corpus (SearchCorpus): The slide summaries to index.
+
+        Returns:
+            faiss.Index: The FAISS index.
+        """
+        fingerprint = self._fingerprint(corpus)
+        if fingerprint in self._index_cache:
+            return self._index_cache[fingerprint]
+
+        index = self._load_index(fingerprint)
+        if index is None:
+            # Generate embeddings for all slide texts directly as a NumPy array,
+            # only running the model on texts not already in the on-disk cache
+            embeddings = self.embedding_cache.encode(corpus.texts, self._encode_texts)
+
+            index = self._build_index(embeddings)
+            self._save_index(index, fingerprint)
+
+        self._index_cache[fingerprint] = index
+        return index
+
+    def _fingerprint(self, corpus):
+        """
+        Internal helper method computing a stable fingerprint of the corpus
+        and embedding model, used to tell whether a persisted index is still valid.
+
+        Args:
+            corpus (SearchCorpus): The slide summaries to index.
+
+        Returns:
+            str: The hex digest of the model name and the corpus contents.
+        """
+        digest = new_hasher()
+        digest.update(self.EMBEDDING_MODEL_NAME.encode("utf-8"))
+        for filename, slide_num, text in zip(corpus.filenames, corpus.slide_nums, corpus.texts):
+            digest.update(f"\x00{filename}\x00{slide_num}\x00{text}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_index(self, fingerprint):
+        """
+        Internal helper method to load the persisted FAISS index, if it was built
+        from the same corpus. The index file is memory-mapped where the index
+        type supports it, so loading is cheap and memory stays low.
+
+        Args:
+            fingerprint (str): The fingerprint of the current corpus.
+
+        Returns:
+            faiss.Index or None: The index, or None if there is no valid persisted index.
+        """
+        import faiss
+
+        if not (os.path.exists(self.INDEX_PATH) and os.path.exists(self.INDEX_META_PATH)):
+            return None
+        try:
+            with open(self.INDEX_META_PATH, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("fingerprint") != fingerprint:
+                return None
+            try:
+                index = faiss.read_index(self.INDEX_PATH, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            except RuntimeError:
+                # Not every index type can be memory-mapped
+                index = faiss.read_index(self.INDEX_PATH)
+            print(f"📂 Loaded search index from: {self.INDEX_PATH}")
+            return index
+        except Exception as e:
+            print(f"⚠️ Could not load search index '{self.INDEX_PATH}': {e}. Rebuilding it.")
+            return None
+
+    def _save_index(self, index, fingerprint):
+        """
+        Internal helper method to persist the FAISS index and the fingerprint
+        of the corpus it was built from.
+
+        Args:
+            index (faiss.Index): The built index.
+            fingerprint (str): The fingerprint of the corpus the index was built from.
+        """
+        import faiss
+
+        try:
+            os.makedirs(os.path.dirname(self.INDEX_PATH), exist_ok=True)
+            # Write to temporary files first so readers never see a half-written index
+            faiss.write_index(index, self.INDEX_PATH + ".tmp")
+            with open(self.INDEX_META_PATH + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint}, f)
+            os.replace(self.INDEX_PATH + ".tmp", self.INDEX_PATH)
+            os.replace(self.INDEX_META_PATH + ".tmp", self.INDEX_META_PATH)
+        except Exception as e:
+            print(f"⚠️ Could not save search index to '{self.INDEX_PATH}': {e}")
+
+    def _encode_texts(self, texts):
+        """
+        Internal helper method to encode texts into L2-normalized float32 embeddings.
+        Large corpora on a multi-core CPU are sharded across worker processes;
+        everything else is encoded in-process with large batches.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            numpy.ndarray: A (len(texts), d) float32 array of normalized embeddings.
+        """
+        import faiss
+        import torch
+
+        if (len(texts) > self.MULTI_PROCESS_MIN_TEXTS and (os.cpu_count() or 1) > 1
+                and self.model.device.type == "cpu"):
+            pool = self.model.start_multi_process_pool()
+            try:
+                embeddings = self.model.encode_multi_process(texts, pool, batch_size=64)
+            finally:
+                self.model.stop_multi_process_pool(pool)
+            # Normalize in place so inner product equals cosine similarity
+            faiss.normalize_L2(embeddings)
+            return embeddings
+
+        # inference_mode skips autograd bookkeeping entirely
+        with torch.inference_mode():
+            return self.model.encode(
+                texts,
+                batch_size=128,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=len(texts) > 256,
+            )
+
+    def _build_index(self, embeddings):
+        """
+        Internal helper method to build a FAISS index over normalized embeddings.
+        Inner product on L2-normalized vectors is cosine similarity.
+
+        Args:
+            embeddings (numpy.ndarray): A (num_slides, d) float32 array of
+                                        L2-normalized slide embeddings.
+
+        Returns:
+            faiss.Index: An exact IndexFlatIP for small corpora, an 8-bit
+                         IndexScalarQuantizer for medium ones, or an approximate
+                         8-bit IndexHNSWSQ for large ones.
+        """
+        import faiss
+
+        # Get the dimensionality of the embeddings (vector dimension)
+        d = embeddings.shape[1]
+
+        if len(embeddings) >= self.HNSW_MIN_SLIDES:
+            # HNSW graph with 32 neighbours per node gives ~log(N) search at high recall
+            index = faiss.IndexHNSWSQ(d, faiss.ScalarQuantizer.QT_8bit, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 40
+        elif len(embeddings) >= self.QUANTIZE_MIN_SLIDES:
+            index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+        else:
+            # Exact cosine similarity search for small corpora, where there is too
+            # little data to train the quantizer's per-dimension ranges
+            index = faiss.IndexFlatIP(d)
+
+        # Learn the per-dimension value ranges used for 8-bit quantization
+        if not index.is_trained:
+            index.train(embeddings)
+
+        # Add the slide embeddings to the FAISS index
+        index.add(embeddings)
+        return index
+
     def save_images(self, images, output_folder="output_images"):
         """
         Saves a list of PIL Image objects to the specified output folder.
@@ -203,6 +642,8 @@ class PPTConverterAndSearch:
         Args:
             img (PIL.Image.Image): The image to display.
         """
+        import matplotlib.pyplot as plt # For displaying images
+
         plt.figure(figsize=(10, 7)) # Optional: Set figure size for better display
         plt.imshow(img)
         plt.axis('off') # Hide axes for cleaner image display
@@ -1,5 +1,9 @@
 import json
 import os
+try:
+    import orjson # Fast C-accelerated JSON library, used when installed
+except ImportError:
+    orjson = None
 
 class JSONManager:
     """
@@ -46,6 +50,8 @@ class JSONManager:
     def _write_file(self, data):
         """
         Writes the given data to the JSON file.
+        The data is written to a temporary file which then atomically replaces
+        the JSON file, so a crash mid-write never leaves a corrupt file behind.
 
         This is a private helper method, indicated by the leading underscore.
 
@@ -53,8 +59,14 @@ class JSONManager:
             data (dict): The dictionary data to write to the JSON file.
         """
         try:
-            with open(self.json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            tmp_path = self.json_path + ".tmp"
+            if orjson:
+                with open(tmp_path, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=4)
+            os.replace(tmp_path, self.json_path)
             print(f"Successfully saved JSON file at {self.json_path}")
         except IOError as e:
             print(f"Error writing to JSON file '{self.filename}': {e}")
@@ -69,8 +81,13 @@ class JSONManager:
         Assumes the file exists and is valid JSON. Error handling for malformed
         JSON is done in the __init__ method.
         """
-        with open(self.json_path, "r", encoding="utf-8") as file:
-            self.data = json.load(file)
+        if orjson:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so __init__ handles both
+            with open(self.json_path, "rb") as file:
+                self.data = orjson.loads(file.read())
+        else:
+            with open(self.json_path, "r", encoding="utf-8") as file:
+                self.data = json.load(file)
         print(f"Successfully loaded JSON data from {self.json_path}")
 
     def get_data(self):
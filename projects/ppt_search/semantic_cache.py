@@ -0,0 +1,172 @@
+import os
+import threading
+from functools import cached_property
+import numpy as np
+from embedding_model import EMBEDDING_MODEL_NAME, load_embedding_model # Shared, lazily loaded model
+
+class SemanticSummaryCache:
+    """
+    Reuses summaries of near-duplicate slides ("Agenda", "Thank You", title and
+    section slides repeated across decks) by embedding similarity, so slides whose
+    text differs only slightly from an already summarized slide skip the LLM call.
+
+    Stored slides are kept as L2-normalized float32 vectors next to their summaries
+    in a single .npz file; a lookup is one matrix-vector product per slide.
+    """
+    EMBEDDING_MODEL_NAME = EMBEDDING_MODEL_NAME
+
+    def __init__(self, path=os.path.join("text_output", "semantic_cache.npz"), threshold=0.92, summary_model=None):
+        """
+        Initializes the SemanticSummaryCache and loads stored entries from disk.
+
+        Args:
+            path (str): The path to the .npz file holding the stored vectors and summaries
+                        (default: "text_output/semantic_cache.npz").
+            threshold (float): The minimum cosine similarity for a stored summary to be
+                               reused (default: 0.92).
+            summary_model (str, optional): The LLM that writes the summaries. Entries stored
+                                           for another model are discarded on load, so
+                                           switching models re-summarizes slides.
+        """
+        self.path = path
+        self.threshold = threshold
+        self.summary_model = summary_model or ""
+        # Guards the stored entries: lookups may run on a worker thread while summaries are added
+        self._lock = threading.Lock()
+        self._vectors, self._summaries = self._load()
+        # Entries added since the arrays were last rebuilt; concatenated once when needed
+        self._new_vectors = []
+        self._new_summaries = []
+        # Vectors of looked-up slides that missed, kept until their summary is added
+        self._pending = {}
+
+    @cached_property
+    def model(self):
+        """
+        The SentenceTransformer model used for embedding slide texts.
+        Loaded lazily on first access, so runs without cache misses never load it,
+        and shared with the search converter so a run loads it only once.
+
+        Returns:
+            SentenceTransformer: The loaded embedding model.
+        """
+        return load_embedding_model(self.EMBEDDING_MODEL_NAME)
+
+    def lookup(self, texts):
+        """
+        Finds stored summaries for slides similar to the given texts.
+
+        Args:
+            texts (list): The raw (non-empty) slide texts to look up.
+
+        Returns:
+            list: For each text, the summary of the most similar stored slide if its
+                  similarity reaches the threshold, otherwise None.
+        """
+        if not texts:
+            return []
+        import torch
+
+        with torch.inference_mode():
+            queries = self.model.encode(
+                texts,
+                batch_size=128,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            ).astype("float32")
+
+        results = [None] * len(texts)
+        with self._lock:
+            vectors, summaries = self._consolidate()
+            if len(summaries):
+                # Vectors are normalized, so the inner product is the cosine similarity
+                similarities = queries @ vectors.T
+                best = similarities.argmax(axis=1)
+                for i, j in enumerate(best):
+                    if similarities[i, j] >= self.threshold:
+                        results[i] = str(summaries[j])
+
+            for text, vector, summary in zip(texts, queries, results):
+                if summary is None:
+                    self._pending[text] = vector
+        return results
+
+    def add(self, text, summary):
+        """
+        Stores the summary of a slide that was previously looked up and missed.
+        Texts that were never looked up are ignored.
+
+        Args:
+            text (str): The raw slide text.
+            summary (str): The summary generated for it.
+        """
+        with self._lock:
+            vector = self._pending.pop(text, None)
+            if vector is None:
+                return
+            self._new_vectors.append(vector)
+            self._new_summaries.append(summary)
+
+    def save(self):
+        """
+        Writes the stored vectors and summaries to disk atomically.
+        """
+        with self._lock:
+            vectors, summaries = self._consolidate()
+        if not self.path or not len(summaries):
+            return
+        try:
+            cache_dir = os.path.dirname(self.path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first so an interrupted run never corrupts the cache
+            tmp_path = self.path + ".tmp.npz"
+            np.savez(tmp_path, model=np.array(self.EMBEDDING_MODEL_NAME),
+                     summary_model=np.array(self.summary_model),
+                     vectors=vectors, summaries=summaries)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not save semantic cache '{self.path}': {e}")
+
+    def _consolidate(self):
+        """
+        Internal helper method that appends the entries added since the last call to
+        the stored arrays in one concatenation. Must be called with the lock held.
+
+        Returns:
+            tuple: The (n, d) float32 vectors and the n summaries.
+        """
+        if self._new_summaries:
+            new_vectors = np.stack(self._new_vectors)
+            if len(self._summaries):
+                self._vectors = np.concatenate([self._vectors, new_vectors])
+            else:
+                self._vectors = new_vectors
+            self._summaries = np.concatenate([self._summaries, np.array(self._new_summaries, dtype=str)])
+            self._new_vectors = []
+            self._new_summaries = []
+        return self._vectors, self._summaries
+
+    def _load(self):
+        """
+        Internal helper method to load stored entries from disk.
+
+        Returns:
+            tuple: The (n, d) float32 vectors and the n summaries. Both are empty if the
+                   file does not exist, cannot be read, or was built with another
+                   embedding model or summary model.
+        """
+        empty = (np.empty((0, 0), dtype="float32"), np.array([], dtype=str))
+        if not self.path or not os.path.exists(self.path):
+            return empty
+        try:
+            with np.load(self.path) as data:
+                if str(data["model"]) != self.EMBEDDING_MODEL_NAME:
+                    return empty
+                # Files written before summary models were recorded cannot be trusted either
+                if "summary_model" not in data.files or str(data["summary_model"]) != self.summary_model:
+                    return empty
+                return data["vectors"], data["summaries"]
+        except Exception as e:
+            print(f"⚠️ Could not read semantic cache '{self.path}': {e}. Starting with an empty cache.")
+            return empty
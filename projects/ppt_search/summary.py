@@ -1,12 +1,319 @@
 import os
+import asyncio # For concurrent requests through async LLM clients
+import collections
+import contextlib
+import functools
+import importlib.util
+import itertools
 import json # Import json for saving summaries
-from pptx import Presentation
-import openai # Keep import here for type hinting/clarity even if client is dynamic
-import matplotlib.pyplot as plt
+import posixpath
+import random
+import re
+import threading
+import time
+import uuid
+import zipfile # .pptx files are ZIP archives of XML parts
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor # Processes for parsing, threads for LLM requests
+from lxml import etree # Installed with python-pptx; used to read slide XML directly
+try:
+    import orjson # Fast C-accelerated JSON library, used when installed
+except ImportError:
+    orjson = None
+from cache_keys import content_key # For content-addressed summary cache keys
+from semantic_cache import SemanticSummaryCache # For reusing summaries of near-duplicate slides
 from tqdm import tqdm
-# Import specific client libraries, but only initialize them if selected
-# from groq import Groq # Not needed at the top level if imported conditionally
-# import google.generativeai as genai # Not needed at the top level if imported conditionally
+from tqdm.asyncio import tqdm_asyncio
+# Client libraries and matplotlib are imported where they are used, so only the
+# selected provider's SDK has to be installed and startup stays fast
+
+# OOXML namespaces used when reading slide XML directly
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+# Slides consisting only of one of these phrases are summarized without an LLM call
+_BOILERPLATE_SLIDE = re.compile(
+    r"(thank you( very much| for your (time|attention))?|thanks|(any )?questions( (and|or) (answers|comments))?"
+    r"|agenda|q ?& ?a|appendix|backup|\d+)[.!?:]*",
+    re.IGNORECASE,
+)
+# Clark-notation tags of DrawingML paragraphs and text runs, as matched by iterparse
+_A_P = f"{{{_NS['a']}}}p"
+_A_T = f"{{{_NS['a']}}}t"
+_A_BR = f"{{{_NS['a']}}}br"
+
+
+def _write_json_atomic(path, data):
+    """
+    Writes data to a JSON file through a temporary file that atomically replaces
+    it, so a crash mid-write never leaves a partial file. Uses orjson when installed.
+
+    Args:
+        path (str): The path of the JSON file.
+        data (dict): The data to write.
+    """
+    tmp_path = path + ".tmp"
+    if orjson:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def _event_loop_running():
+    """
+    Checks whether this thread is already running an event loop, as it is inside
+    a Jupyter notebook, where `asyncio.run` cannot start another one.
+
+    Returns:
+        bool: True if an event loop is running in the current thread.
+    """
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def _read_json(path):
+    """
+    Reads a JSON file, using orjson when installed.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        The decoded JSON data.
+    """
+    if orjson:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_pptx_files(folder_path):
+    """
+    Lists the .pptx files directly inside a folder using a single directory scan.
+    Matching is case-insensitive, and PowerPoint's '~$' lock files are skipped.
+
+    Args:
+        folder_path (str): The folder to scan.
+
+    Returns:
+        list: Paths of the .pptx files, sorted by file name.
+    """
+    with os.scandir(folder_path) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.name.lower().endswith(".pptx") and not entry.name.startswith("~$") and entry.is_file()
+        )
+
+
+def _slide_part_names(pptx_zip):
+    """
+    Returns the ZIP part names of a presentation's slides in presentation order.
+    Slide file numbers do not necessarily follow the slide order, which is
+    defined by the slide id list in 'ppt/presentation.xml'.
+
+    Args:
+        pptx_zip (zipfile.ZipFile): The opened .pptx archive.
+
+    Returns:
+        list: Part names such as "ppt/slides/slide1.xml", in slide order.
+    """
+    rels = etree.fromstring(pptx_zip.read("ppt/_rels/presentation.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target") for rel in rels.iterfind("rel:Relationship", _NS)}
+
+    presentation = etree.fromstring(pptx_zip.read("ppt/presentation.xml"))
+    part_names = []
+    for slide_id in presentation.iterfind("p:sldIdLst/p:sldId", _NS):
+        target = targets[slide_id.get(f"{{{_NS['r']}}}id")]
+        # Targets are usually relative to 'ppt/', but may be absolute within the package
+        if target.startswith("/"):
+            part_names.append(target.lstrip("/"))
+        else:
+            part_names.append(posixpath.normpath(posixpath.join("ppt", target)))
+    return part_names
+
+
+def _extract_slide_texts(pptx_path):
+    """
+    Extracts the text of every slide in a .pptx file by streaming the `<a:t>`
+    text runs straight from the slide XML, without building python-pptx's
+    shape objects or a full element tree per slide.
+
+    Args:
+        pptx_path (str): The path to the PowerPoint file.
+
+    Returns:
+        list: One string per slide, in slide order, with the slide's paragraphs
+              joined by spaces.
+    """
+    slides_text = []
+    with zipfile.ZipFile(pptx_path) as pptx_zip:
+        for part_name in _slide_part_names(pptx_zip):
+            with pptx_zip.open(part_name) as slide_xml:
+                slides_text.append(_stream_slide_text(slide_xml))
+    return slides_text
+
+
+def _stream_slide_text(slide_xml):
+    """
+    Reads the text of one slide from its XML part with `iterparse`, clearing
+    each paragraph once its text is collected so memory stays bounded by the
+    largest paragraph rather than the whole slide.
+
+    Text runs are collected as-is and joined once per slide, with a space for
+    each paragraph end and line break (`<a:br/>`); the whitespace
+    normalization (and stripping) also happens once, at the slide level.
+
+    Args:
+        slide_xml (file): The open slide XML part.
+
+    Returns:
+        str: The slide's paragraphs joined by single spaces.
+    """
+    pieces = []
+    # recover=True skips over malformed markup instead of failing the whole slide
+    for _, element in etree.iterparse(slide_xml, events=("end",), tag=(_A_T, _A_BR, _A_P), recover=True):
+        if element.tag == _A_T:
+            # Runs within a paragraph are fragments of the same line, so they get no separator
+            pieces.append(element.text or "")
+            continue
+        if element.tag == _A_BR:
+            # A soft line break (Shift+Enter) separates words just like a paragraph does
+            pieces.append(" ")
+            continue
+        pieces.append(" ")
+        # Free the finished paragraph and any already-processed siblings
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    return " ".join("".join(pieces).split())
+
+
+def _extract_slide_texts_pptx(pptx_path):
+    """
+    Fallback text extractor built on python-pptx, for packages whose structure
+    the direct XML reader cannot follow.
+
+    Args:
+        pptx_path (str): The path to the PowerPoint file.
+
+    Returns:
+        list: One string per slide, in slide order, with the text of each shape
+              joined by spaces.
+    """
+    from pptx import Presentation # Only needed for the fallback path
+
+    slides_text = []
+    for slide in Presentation(pptx_path).slides:
+        parts = []
+        for shape in slide.shapes:
+            # has_text_frame is a cheap property check, unlike hasattr(shape, "text")
+            if shape.has_text_frame:
+                text = shape.text_frame.text.strip()
+                if text:
+                    parts.append(text)
+        slides_text.append(" ".join(parts))
+    return slides_text
+
+
+def _extract_one(pptx_path):
+    """
+    Extracts the slide texts of one .pptx file. Defined at module level so it
+    can be sent to worker processes.
+
+    Args:
+        pptx_path (str): The path to the PowerPoint file.
+
+    Returns:
+        tuple: The file name and its list of slide texts.
+    """
+    try:
+        slides_text = _extract_slide_texts(pptx_path)
+    except (KeyError, etree.XMLSyntaxError):
+        # Missing or unexpected package parts; let python-pptx resolve them
+        slides_text = _extract_slide_texts_pptx(pptx_path)
+    return os.path.basename(pptx_path), slides_text
+
+
+class _AsyncRateLimiter:
+    """
+    Sliding-window rate limiter for async requests: allows at most `max_requests`
+    requests to start within any `period`-second window, matching how providers
+    count requests per minute.
+    """
+
+    def __init__(self, max_requests, period=60.0):
+        """
+        Initializes the rate limiter.
+
+        Args:
+            max_requests (int): The maximum number of requests per window.
+            period (float): The window length in seconds. Defaults to 60.
+        """
+        self.max_requests = max(1, int(max_requests))
+        self.period = period
+        self._timestamps = collections.deque() # Start times of requests in the current window
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Waits until a request may be sent without exceeding the limit, then records it.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                # Forget requests that have left the window
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.max_requests:
+                    self._timestamps.append(now)
+                    return
+                # Sleep until the oldest request in the window expires
+                await asyncio.sleep(self.period - (now - self._timestamps[0]))
+
+
+class _RateLimiter:
+    """
+    Thread-safe counterpart of `_AsyncRateLimiter`, used when slides are
+    summarized through the thread pool.
+    """
+
+    def __init__(self, max_requests, period=60.0):
+        """
+        Initializes the rate limiter.
+
+        Args:
+            max_requests (int): The maximum number of requests per window.
+            period (float): The window length in seconds. Defaults to 60.
+        """
+        self.max_requests = max(1, int(max_requests))
+        self.period = period
+        self._timestamps = collections.deque() # Start times of requests in the current window
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent without exceeding the limit, then records it.
+        """
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                # Forget requests that have left the window
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.max_requests:
+                    self._timestamps.append(now)
+                    return
+                # Sleep until the oldest request in the window expires
+                time.sleep(self.period - (now - self._timestamps[0]))
 
 
 class SlideSummarizer:
@@ -16,56 +323,219 @@ class SlideSummarizer:
     and can optionally save these summaries.
     """
 
-    def __init__(self, folder_path, model="gpt-4o", provider="openai", save_path=None):
+    # Retry settings for rate-limited (HTTP 429) LLM requests
+    MAX_RETRIES = 5
+    BASE_BACKOFF_SECONDS = 1.0
+    MAX_BACKOFF_SECONDS = 30.0
+    # Per-request timeout for LLM API calls
+    REQUEST_TIMEOUT_SECONDS = 30
+    # New summaries between summary cache writes within a file (each finished file is always written)
+    CHECKPOINT_EVERY_SLIDES = 50
+    # Below this many files, extraction runs in-process instead of starting worker processes
+    PROCESS_POOL_MIN_FILES = 2
+    # Default request rate limits per provider, used when requests_per_minute is not given
+    DEFAULT_REQUESTS_PER_MINUTE = {"groq": 30}
+    # Batch API settings (mode="batch"), shared by OpenAI and Groq
+    BATCH_ENDPOINT = "/v1/chat/completions"
+    BATCH_COMPLETION_WINDOW = "24h"
+    BATCH_POLL_SECONDS = 30
+
+    # Per-slide input budget. Summaries are two lines, so long slides gain little beyond this
+    MAX_SLIDE_TOKENS = 1024
+    MAX_SLIDE_CHARS = 3000 # Used instead when tiktoken is not installed
+    FALLBACK_TOKEN_ENCODING = "o200k_base"
+
+    # Small, fast models per provider; a 2-line summary does not need a frontier model
+    DEFAULT_MODELS = {
+        "openai": "gpt-4o-mini",
+        "groq": "llama-3.1-8b-instant",
+        "gemini": "gemini-1.5-flash",
+        "vllm": "meta-llama/Llama-3.1-8B-Instruct",
+    }
+    # Sequences the local vLLM engine schedules into one GPU batch (provider="vllm")
+    VLLM_MAX_NUM_SEQS = 64
+    # Output budget per slide summary; two concise lines fit in about 60 tokens
+    SUMMARY_MAX_TOKENS = 80
+    # Single-slide summaries end after their second line; these stop anything beyond it
+    SUMMARY_STOP_SEQUENCES = ["\n\n", "\n3."]
+
+    # Static instructions, sent as the system prompt. Keeping them out of the user message
+    # gives every request the same prefix, which providers can cache across requests.
+    # Instructs for a 2-line summary, avoids repetition, and suggests analyzing empty slides.
+    SUMMARY_INSTRUCTION = (
+        "Summarize the slide content you are given in exactly two concise lines. "
+        "Do not use phrases like '2-line summary' or 'summary of the slide'. "
+        "Be direct and to the point. If the content is sparse, infer the slide's likely purpose. "
+        "Also, anticipate potential questions a user might have about this slide's topic."
+    )
+    BATCH_SUMMARY_INSTRUCTION = (
+        "Summarize each of the numbered slides you are given in exactly two concise lines. "
+        "Do not use phrases like '2-line summary' or 'summary of the slide'. "
+        "Be direct and to the point. If the content is sparse, infer the slide's likely purpose. "
+        "Also, anticipate potential questions a user might have about each slide's topic.\n"
+        'Return a JSON object of the form {"summaries": ["...", "..."]} with exactly one string '
+        "per slide, in slide order."
+    )
+
+    EMPTY_SLIDE_SUMMARY = "[Slide has no detectable content, consider its purpose visually.]"
+    # Slides with fewer words than this (or boilerplate text) get a templated summary instead of an LLM call
+    MIN_SLIDE_WORDS = 4
+    SHORT_SLIDE_SUMMARY = "Short slide reading '{text}'.\nLikely a title, section divider, agenda or closing slide."
+
+    def __init__(self, folder_path, model=None, provider="openai", save_path=None, max_workers=8,
+                 cache_path=os.path.join("text_output", "summary_cache.json"), requests_per_minute=None, batch_size=8,
+                 mode="online", semantic_cache_path=os.path.join("text_output", "semantic_cache.npz"),
+                 semantic_threshold=0.92, summary_model=None):
         """
         Initializes the SlideSummarizer.
 
         Args:
             folder_path (str): The path to the folder containing .pptx files.
-            model (str): The specific LLM model to use (e.g., "gpt-4o", "llama3-8b-8192", "gemini-pro").
-                         Defaults to "gpt-4o".
-            provider (str): The LLM service provider to use ('openai', 'groq', 'gemini').
+            model (str, optional): The specific LLM model to use (e.g., "gpt-4o", "llama3-8b-8192",
+                                   "gemini-pro"). Defaults to the provider's small, fast model from
+                                   `DEFAULT_MODELS`, which is sufficient for 2-line summaries.
+            provider (str): The LLM service provider to use ('openai', 'groq', 'gemini'), or 'vllm'
+                            to run the model locally on a GPU with vLLM (no API key needed).
                             Defaults to "openai".
             save_path (str, optional): The path to a JSON file where summaries will be saved.
+                                       It is rewritten after each finished file, so an
+                                       interrupted run keeps its progress.
                                        If None, summaries are not saved to a file.
+            max_workers (int): The maximum number of requests sent concurrently.
+                               Defaults to 8.
+            cache_path (str, optional): The path to a JSON file mapping slide content hashes
+                                        to summaries, so unchanged slides are not re-summarized
+                                        across runs. If None, no cache is used.
+                                        Defaults to "text_output/summary_cache.json".
+            requests_per_minute (int, optional): The maximum number of requests started in any
+                                                 60-second window when summarizing through an async
+                                                 API. Defaults to the provider's known limit (30 for
+                                                 Groq), or no limit for other providers.
+            batch_size (int): The maximum number of slides summarized in a single LLM request.
+                              Use 1 to send one request per slide. Defaults to 8.
+            mode (str): 'online' to summarize through regular API requests, or 'batch' to submit
+                        all requests as one discounted Batch API job and wait for its results
+                        (OpenAI and Groq only). Batch jobs can take hours, so use it for offline
+                        runs that save their summaries. Defaults to "online".
+            semantic_cache_path (str, optional): The path to a .npz file of slide embeddings and
+                                                 summaries. Slides that miss the exact cache but are
+                                                 near-duplicates of a summarized slide reuse its summary.
+                                                 If None, only exact matches are reused.
+                                                 Defaults to "text_output/semantic_cache.npz".
+            semantic_threshold (float): The minimum cosine similarity for a near-duplicate slide
+                                        to reuse a summary. Defaults to 0.92.
+            summary_model (str, optional): The model used for slide summaries, when it should differ
+                                           from `model` (e.g. a cheaper tier). Defaults to `model`.
         
         Raises:
-            ValueError: If an unsupported LLM provider is specified.
+            ValueError: If an unsupported LLM provider or mode is specified.
             KeyError: If the required API key environment variable is not set.
+            ImportError: If the selected provider's SDK is not installed.
         """
         self.folder_path = folder_path
-        self.model = model
         self.provider = provider.lower()
+        self.model = model or self.DEFAULT_MODELS.get(self.provider)
+        self.summary_model = summary_model or self.model
         self.save_path = save_path
+        self.max_workers = max_workers
+        self._max_in_flight = max_workers # Concurrent async requests; raised for local vLLM
+        self._event_loop = None # Persistent event loop, only needed by the vLLM engine
+        self.batch_size = max(1, batch_size)
+        self.mode = mode.lower()
+        self.cache_path = cache_path
+        self.summary_cache = self._load_summary_cache()
+        self._unsaved_summaries = 0 # New cache entries since the cache was last written
+        self.semantic_cache = None
+        if semantic_cache_path:
+            self.semantic_cache = SemanticSummaryCache(
+                semantic_cache_path, threshold=semantic_threshold, summary_model=self.summary_model
+            )
+        self.requests_per_minute = requests_per_minute or self.DEFAULT_REQUESTS_PER_MINUTE.get(self.provider)
+        # Thread-pool requests share one limiter; the async one is created per run, bound to its loop
+        self._sync_rate_limiter = _RateLimiter(self.requests_per_minute) if self.requests_per_minute else None
         self.client = None # Initialize client to None
+        # Slides are summarized through the provider's async API when the SDK has one,
+        # otherwise through a thread pool. OpenAI-compatible SDKs need a separate async client.
+        self._use_async = False
+        self._async_client_factory = None
 
         # --- Initialize LLM Client based on provider ---
         if self.provider == "openai":
+            try:
+                import openai # Import here to avoid unnecessary dependency if not used
+            except ImportError as e:
+                raise ImportError("The 'openai' provider requires the openai package: pip install openai") from e
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 raise KeyError("OPENAI_API_KEY environment variable not set.")
             self.client = openai.OpenAI(api_key=api_key) # Use openai.OpenAI() for new client
+            self._async_client_factory = functools.partial(
+                openai.AsyncOpenAI, api_key=api_key, timeout=self.REQUEST_TIMEOUT_SECONDS
+            )
+            self._use_async = True
             print("🚀 Initialized OpenAI client.")
         elif self.provider == "groq":
-            from groq import Groq # Import here to avoid unnecessary dependency if not used
+            try:
+                from groq import Groq # Import here to avoid unnecessary dependency if not used
+            except ImportError as e:
+                raise ImportError("The 'groq' provider requires the groq package: pip install groq") from e
             api_key = os.environ.get("GROQ_API_KEY")
             if not api_key:
                 raise KeyError("GROQ_API_KEY environment variable not set.")
-            self.client = Groq(api_key=api_key)
+            self.client = Groq(api_key=api_key, timeout=self.REQUEST_TIMEOUT_SECONDS)
+            try:
+                from groq import AsyncGroq
+                self._async_client_factory = functools.partial(
+                    AsyncGroq, api_key=api_key, timeout=self.REQUEST_TIMEOUT_SECONDS
+                )
+                self._use_async = True
+            except ImportError:
+                pass # Older groq releases have no async client; fall back to the thread pool
             print("🚀 Initialized Groq client.")
         elif self.provider == "gemini":
-            import google.generativeai as genai # Import here
+            try:
+                import google.generativeai as genai # Import here
+            except ImportError as e:
+                raise ImportError(
+                    "The 'gemini' provider requires the google-generativeai package: pip install google-generativeai"
+                ) from e
             api_key = os.environ.get("GOOGLE_API_KEY")
             if not api_key:
                 raise KeyError("GOOGLE_API_KEY environment variable not set.")
             genai.configure(api_key=api_key)
             self.client = genai # The client is the genai module itself for Gemini
+            self._gemini_models = {} # GenerativeModel per system instruction, see _gemini_model
+            # generate_content_async is available in all but very old SDK releases
+            self._use_async = hasattr(genai.GenerativeModel, "generate_content_async")
             print("🚀 Initialized Gemini client.")
+        elif self.provider == "vllm":
+            try:
+                from vllm import AsyncEngineArgs, AsyncLLMEngine, SamplingParams # Import here
+            except ImportError as e:
+                raise ImportError("The 'vllm' provider requires the vllm package: pip install vllm") from e
+            self.engine = AsyncLLMEngine.from_engine_args(
+                AsyncEngineArgs(model=self.summary_model, max_num_seqs=self.VLLM_MAX_NUM_SEQS)
+            )
+            self._sampling_params = SamplingParams
+            self._vllm_tokenizer = None
+            # The engine's background loop is bound to the event loop it first runs on,
+            # so every run of this summarizer reuses one loop instead of asyncio.run
+            self._event_loop = asyncio.new_event_loop()
+            # The engine batches all concurrent requests on the GPU itself (continuous batching),
+            # so keep enough requests in flight to fill its batch
+            self._max_in_flight = max(self.max_workers, self.VLLM_MAX_NUM_SEQS)
+            self._use_async = True
+            print(f"🚀 Initialized local vLLM engine for '{self.summary_model}'.")
         else:
             raise ValueError(
-                f"Unsupported provider: '{self.provider}'. Choose from: 'openai', 'groq', 'gemini'."
+                f"Unsupported provider: '{self.provider}'. Choose from: 'openai', 'groq', 'gemini', 'vllm'."
             )
 
+        if self.mode not in ("online", "batch"):
+            raise ValueError(f"Unsupported mode: '{self.mode}'. Choose from: 'online', 'batch'.")
+        if self.mode == "batch" and self.provider not in ("openai", "groq"):
+            raise ValueError(f"Batch mode is not supported for provider '{self.provider}'.")
+
         # Ensure the folder path exists
         if not os.path.isdir(self.folder_path):
             raise FileNotFoundError(f"Folder not found: {self.folder_path}")
@@ -80,41 +550,106 @@ class SlideSummarizer:
     def extract_pptx_text(self):
         """
         Extracts all textual content from each slide of .pptx files
-        within the specified folder.
+        within the specified folder. Files are parsed in parallel worker
+        processes, since unzipping and XML parsing are CPU-bound.
 
         Returns:
             dict: A dictionary where keys are PowerPoint filenames (e.g., "presentation.pptx")
                   and values are lists of strings, where each string is the concatenated
                   text content of a single slide.
         """
-        extracted_texts = {}
+        return dict(self._iter_extracted())
+
+    def iter_slides(self):
+        """
+        Lazily extracts the slides of all .pptx files in the folder, one file at a
+        time, so the text of the whole corpus is never held in memory at once.
+
+        Yields:
+            tuple: (filename, slide index, slide text) for every slide, in file and slide order.
+        """
+        for filename, slides_text in self._iter_extracted():
+            for slide_idx, slide_text in enumerate(slides_text):
+                yield filename, slide_idx, slide_text
+
+    def _iter_extracted(self):
+        """
+        Internal helper method that extracts the .pptx files in the folder, yielding
+        each file's slide texts in file order as soon as it is ready. Only a small
+        window of files is parsed ahead in the worker processes, which bounds memory
+        for large folders. Files that cannot be read are reported and skipped.
+
+        Yields:
+            tuple: The filename and its list of slide texts.
+        """
         print(f"📖 Extracting text from PPTX files in: {self.folder_path}")
-        for file in os.listdir(self.folder_path):
-            if file.endswith(".pptx"):
-                full_path = os.path.join(self.folder_path, file)
-                try:
-                    prs = Presentation(full_path)
-                    slides_text = []
-                    for i, slide in enumerate(prs.slides):
-                        slide_content = []
-                        for shape in slide.shapes:
-                            # Check if the shape has text and if the text is not empty
-                            if hasattr(shape, "text") and shape.text.strip():
-                                slide_content.append(shape.text.strip())
-                        
-                        # Join all text elements on a slide into a single string
-                        text = " ".join(slide_content)
-                        slides_text.append(text)
-                    extracted_texts[file] = slides_text
+        pptx_paths = iter_pptx_files(self.folder_path)
+
+        with contextlib.ExitStack() as stack:
+            if len(pptx_paths) < self.PROCESS_POOL_MIN_FILES:
+                # Not worth the worker start-up cost; extract in this process
+                results = (self._extraction_result(_extract_one, path) for path in pptx_paths)
+            else:
+                workers = min(len(pptx_paths), os.cpu_count() or 1)
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                results = self._iter_in_workers(executor, pptx_paths, window=2 * workers)
+
+            for path, (file, slides_text, error) in zip(pptx_paths, results):
+                file = file or os.path.basename(path)
+                if error is None:
                     print(f"✅ Extracted text from '{file}' ({len(slides_text)} slides).")
-                except Exception as e:
-                    print(f"❌ Error extracting text from '{file}': {e}")
-        return extracted_texts
+                    yield file, slides_text
+                else:
+                    print(f"❌ Error extracting text from '{file}': {error}")
+
+    def _iter_in_workers(self, executor, pptx_paths, window):
+        """
+        Internal helper method that extracts files in worker processes with at most
+        `window` files submitted ahead of the one being consumed.
+
+        Args:
+            executor (ProcessPoolExecutor): The worker pool.
+            pptx_paths (list): The paths of the .pptx files.
+            window (int): The maximum number of files in flight.
+
+        Yields:
+            tuple: The `_extraction_result` of each file, in file order.
+        """
+        paths = iter(pptx_paths)
+        # Futures are kept in file order so the output order does not depend on timing
+        pending = collections.deque(executor.submit(_extract_one, path) for path in itertools.islice(paths, window))
+        while pending:
+            result = self._extraction_result(pending.popleft().result)
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append(executor.submit(_extract_one, next_path))
+            yield result
+
+    @staticmethod
+    def _extraction_result(extract, *args):
+        """
+        Internal helper method that runs (or collects) one file's extraction and
+        captures its error, so a single unreadable file does not stop the others.
+
+        Args:
+            extract (callable): `_extract_one` or a future's `result` method.
+            *args: Arguments passed to `extract`.
+
+        Returns:
+            tuple: The filename (None on error), the slide texts (None on error)
+                   and the error (None on success).
+        """
+        try:
+            file, slides_text = extract(*args)
+            return file, slides_text, None
+        except Exception as e:
+            return None, None, e
 
     def summarize_slide(self, slide_text):
         """
         Summarizes the given slide text using the configured LLM.
-        Handles empty content and truncates long inputs for API limits.
+        Empty, very short and boilerplate slides get a local summary without an
+        LLM call, and long inputs are truncated for API limits.
 
         Args:
             slide_text (str): The raw text content of a single slide.
@@ -123,49 +658,500 @@ class SlideSummarizer:
             str: A 2-line summary of the slide content, or an error message
                  if summarization fails or content is empty.
         """
-        if not slide_text.strip():
-            return "[Slide has no detectable content, consider its purpose visually.]"
-
-        # Truncate long slide texts to avoid exceeding model token limits
-        # A common limit is around 4096 tokens, 3000 chars is a safe buffer.
-        if len(slide_text) > 3000:
-            slide_text = slide_text[:3000] + " [Content truncated...]"
-
-        # Craft the prompt for the LLM
-        # Instructs for a 2-line summary, avoids repetition, and suggests analyzing empty slides.
-        prompt = (
-            "Summarize the following slide content in exactly two concise lines. "
-            "Do not use phrases like '2-line summary' or 'summary of the slide'. "
-            "Be direct and to the point. If the content is sparse, infer the slide's likely purpose. "
-            "Also, anticipate potential questions a user might have about this slide's topic.\n\n"
-            f"Slide Content:\n{slide_text}"
-        )
+        local_summary = self._local_summary(slide_text)
+        if local_summary is not None:
+            return local_summary
 
         try:
-            if self.provider == "openai" or self.provider == "groq":
-                # Both OpenAI and Groq use a similar chat completions API
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.3, # Lower temperature for more factual, less creative summaries
-                )
-                return response.choices[0].message.content.strip()
+            return self._call_with_retries(self._request_summary, self._build_prompt(slide_text))
+        except Exception as e:
+            # Catch any API errors or network issues during summarization
+            return f"[Error summarizing slide: {e}]"
+
+    async def asummarize_slide(self, slide_text):
+        """
+        Async counterpart of `summarize_slide`, sent through the provider's async API.
+        Must be called from within `_asummarize_files`, which sets up the async client,
+        the concurrency semaphore and the rate limiter.
 
-            elif self.provider == "gemini":
-                # Gemini uses GenerativeModel for content generation
-                model_instance = self.client.GenerativeModel(self.model)
-                response = model_instance.generate_content(prompt)
-                return response.text.strip()
+        Args:
+            slide_text (str): The raw text content of a single slide.
+
+        Returns:
+            str: A 2-line summary of the slide content, or an error message
+                 if summarization fails or content is empty.
+        """
+        local_summary = self._local_summary(slide_text)
+        if local_summary is not None:
+            return local_summary
 
+        try:
+            return await self._acall_with_retries(self._arequest_summary, self._build_prompt(slide_text))
         except Exception as e:
             # Catch any API errors or network issues during summarization
             return f"[Error summarizing slide: {e}]"
 
+    def summarize_slides_batch(self, slides_text):
+        """
+        Summarizes several slides with a single LLM request, amortizing the
+        per-request overhead across the batch. The model is asked for a JSON
+        array with one 2-line summary per slide. If the request fails or the
+        response is malformed, each slide is summarized individually instead.
+
+        Args:
+            slides_text (list): The raw text content of each slide.
+
+        Returns:
+            list: One summary (or error message) per slide, in the same order.
+        """
+        summaries, batch_positions = self._split_local_slides(slides_text)
+        if len(batch_positions) == 1:
+            summaries[batch_positions[0]] = self.summarize_slide(slides_text[batch_positions[0]])
+        elif batch_positions:
+            batch = [slides_text[i] for i in batch_positions]
+            try:
+                content = self._call_with_retries(self._request_summary, self._build_batch_prompt(batch), len(batch))
+                batch_summaries = self._parse_batch_summaries(content, len(batch))
+            except Exception:
+                # Malformed or partial JSON (or a failed request): fall back to per-slide calls
+                batch_summaries = [self.summarize_slide(slide_text) for slide_text in batch]
+            for i, summary in zip(batch_positions, batch_summaries):
+                summaries[i] = summary
+        return summaries
+
+    async def asummarize_slides_batch(self, slides_text):
+        """
+        Async counterpart of `summarize_slides_batch`.
+
+        Args:
+            slides_text (list): The raw text content of each slide.
+
+        Returns:
+            list: One summary (or error message) per slide, in the same order.
+        """
+        summaries, batch_positions = self._split_local_slides(slides_text)
+        if len(batch_positions) == 1:
+            summaries[batch_positions[0]] = await self.asummarize_slide(slides_text[batch_positions[0]])
+        elif batch_positions:
+            batch = [slides_text[i] for i in batch_positions]
+            try:
+                content = await self._acall_with_retries(
+                    self._arequest_summary, self._build_batch_prompt(batch), len(batch)
+                )
+                batch_summaries = self._parse_batch_summaries(content, len(batch))
+            except Exception:
+                # Malformed or partial JSON (or a failed request): fall back to per-slide calls
+                batch_summaries = await asyncio.gather(*(self.asummarize_slide(slide_text) for slide_text in batch))
+            for i, summary in zip(batch_positions, batch_summaries):
+                summaries[i] = summary
+        return summaries
+
+    def _split_local_slides(self, slides_text):
+        """
+        Internal helper method that fills in the local summaries of empty, very
+        short and boilerplate slides.
+
+        Args:
+            slides_text (list): The raw text content of each slide.
+
+        Returns:
+            tuple: A list of summaries with only local summaries filled in (others are None),
+                   and the positions of the slides that still need the LLM.
+        """
+        summaries = [self._local_summary(slide_text) for slide_text in slides_text]
+        positions = [i for i, summary in enumerate(summaries) if summary is None]
+        return summaries, positions
+
+    def _local_summary(self, slide_text):
+        """
+        Internal helper method that summarizes slides not worth an LLM call:
+        empty slides, slides with fewer than `MIN_SLIDE_WORDS` words, and slides
+        consisting only of boilerplate such as "Thank you" or "Questions?".
+
+        Args:
+            slide_text (str): The raw text content of a single slide.
+
+        Returns:
+            str or None: The templated summary, or None if the slide needs the LLM.
+        """
+        text = " ".join(slide_text.split())
+        if not text:
+            return self.EMPTY_SLIDE_SUMMARY
+        if len(text.split(" ")) < self.MIN_SLIDE_WORDS or _BOILERPLATE_SLIDE.fullmatch(text):
+            return self.SHORT_SLIDE_SUMMARY.format(text=text)
+        return None
+
+    def _call_with_retries(self, request, *args):
+        """
+        Internal helper method that sends a request, retrying with backoff
+        when the provider rate-limits it. Other errors are raised immediately.
+        Each attempt waits for the rate limiter, which is shared by all worker threads.
+
+        Args:
+            request (callable): The function sending the request.
+            *args: Arguments passed to `request`.
+
+        Returns:
+            The return value of `request`.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            if self._sync_rate_limiter:
+                self._sync_rate_limiter.acquire()
+            try:
+                return request(*args)
+            except Exception as e:
+                if attempt < self.MAX_RETRIES and self._is_rate_limit_error(e):
+                    time.sleep(self._retry_delay(e, attempt))
+                    continue
+                raise
+
+    async def _acall_with_retries(self, request, *args):
+        """
+        Async counterpart of `_call_with_retries`. Each attempt waits for the
+        rate limiter, and at most `max_workers` requests are in flight at once.
+
+        Args:
+            request (callable): The coroutine function sending the request.
+            *args: Arguments passed to `request`.
+
+        Returns:
+            The return value of `request`.
+        """
+        async with self._semaphore:
+            for attempt in range(self.MAX_RETRIES + 1):
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire()
+                try:
+                    return await request(*args)
+                except Exception as e:
+                    if attempt < self.MAX_RETRIES and self._is_rate_limit_error(e):
+                        await asyncio.sleep(self._retry_delay(e, attempt))
+                        continue
+                    raise
+
+    def _truncate(self, slide_text):
+        """
+        Internal helper method truncating long slide texts to avoid exceeding model token limits.
+        Cuts at exactly `MAX_SLIDE_TOKENS` tokens when tiktoken is installed, since character
+        counts are a poor proxy for tokens (CJK text and code use far more tokens per
+        character). Falls back to a `MAX_SLIDE_CHARS` character cutoff otherwise.
+
+        Args:
+            slide_text (str): The raw text content of a single slide.
+
+        Returns:
+            str: The slide text, truncated if necessary.
+        """
+        encoding = self._token_encoding
+        if encoding is None:
+            # A common limit is around 4096 tokens, 3000 chars is a safe buffer.
+            if len(slide_text) > self.MAX_SLIDE_CHARS:
+                slide_text = slide_text[:self.MAX_SLIDE_CHARS] + " [Content truncated...]"
+            return slide_text
+
+        # Slides far below the budget cannot exceed it: byte-level BPE tokens cover at least
+        # one UTF-8 byte each, while a single character (CJK, emoji) may take several tokens
+        if len(slide_text.encode("utf-8")) <= self.MAX_SLIDE_TOKENS:
+            return slide_text
+        tokens = encoding.encode(slide_text, disallowed_special=())
+        if len(tokens) > self.MAX_SLIDE_TOKENS:
+            slide_text = encoding.decode(tokens[:self.MAX_SLIDE_TOKENS]) + " [Content truncated...]"
+        return slide_text
+
+    @functools.cached_property
+    def _token_encoding(self):
+        """
+        The tiktoken encoding used to measure slide texts, loaded on first use.
+        Models tiktoken does not know (Groq's Llama models, Gemini) are measured
+        with the `FALLBACK_TOKEN_ENCODING`, which is close enough for a budget.
+
+        Returns:
+            tiktoken.Encoding or None: The encoding, or None if tiktoken is not installed.
+        """
+        try:
+            import tiktoken # Optional; only used for token-aware truncation
+        except ImportError:
+            return None
+        try:
+            return tiktoken.encoding_for_model(self.summary_model)
+        except KeyError:
+            return tiktoken.get_encoding(self.FALLBACK_TOKEN_ENCODING)
+
+    def _build_prompt(self, slide_text):
+        """
+        Internal helper method to build the summarization prompt for a slide.
+        Only the slide content goes here; the instructions are sent separately
+        as the system prompt (`SUMMARY_INSTRUCTION`).
+
+        Args:
+            slide_text (str): The raw (non-empty) text content of a single slide.
+
+        Returns:
+            str: The user prompt to send to the LLM.
+        """
+        return f"Slide Content:\n{self._truncate(slide_text)}"
+
+    def _build_batch_prompt(self, slides_text):
+        """
+        Internal helper method to build a prompt summarizing several slides at once.
+        The instructions are sent separately as the system prompt (`BATCH_SUMMARY_INSTRUCTION`).
+
+        Args:
+            slides_text (list): The raw (non-empty) text content of each slide.
+
+        Returns:
+            str: The user prompt to send to the LLM.
+        """
+        numbered_slides = "\n\n".join(
+            f"[{i}]\n{self._truncate(slide_text)}" for i, slide_text in enumerate(slides_text, start=1)
+        )
+        return f"Slides ({len(slides_text)}):\n\n{numbered_slides}"
+
+    def _system_instruction(self, slide_count):
+        """
+        Internal helper method returning the static instructions for a request.
+
+        Args:
+            slide_count (int): The number of slides the request summarizes.
+
+        Returns:
+            str: The system prompt.
+        """
+        return self.SUMMARY_INSTRUCTION if slide_count == 1 else self.BATCH_SUMMARY_INSTRUCTION
+
+    @staticmethod
+    def _parse_batch_summaries(content, expected_count):
+        """
+        Internal helper method to parse the JSON response of a batch request.
+
+        Args:
+            content (str): The model's response text.
+            expected_count (int): The number of slides in the batch.
+
+        Returns:
+            list: The summaries, one per slide.
+
+        Raises:
+            ValueError: If the response is not valid JSON or does not hold one
+                        summary string per slide.
+        """
+        summaries = json.loads(content)["summaries"]
+        if (not isinstance(summaries, list) or len(summaries) != expected_count
+                or not all(isinstance(summary, str) for summary in summaries)):
+            raise ValueError(f"Expected {expected_count} summaries in the batch response.")
+        return [summary.strip() for summary in summaries]
+
+    def _request_summary(self, prompt, slide_count=1):
+        """
+        Internal helper method to send a single summarization prompt to the configured LLM.
+
+        Args:
+            prompt (str): The full prompt to send.
+            slide_count (int): The number of slides the prompt summarizes. Prompts for
+                               several slides ask the provider for a JSON response.
+
+        Returns:
+            str: The model's response text.
+        """
+        if self.provider == "openai" or self.provider == "groq":
+            # Both OpenAI and Groq use a similar chat completions API
+            response = self.client.chat.completions.create(**self._chat_request(prompt, slide_count))
+            return response.choices[0].message.content.strip()
+
+        elif self.provider == "gemini":
+            # Gemini uses GenerativeModel for content generation
+            model_instance = self._gemini_model(slide_count)
+            response = model_instance.generate_content(prompt, **self._gemini_request(slide_count))
+            return response.text.strip()
+
+        elif self.provider == "vllm":
+            # The engine only has an async API; drive it on the summarizer's event loop
+            return self._run_async(self._arequest_summary(prompt, slide_count))
+
+    async def _arequest_summary(self, prompt, slide_count=1):
+        """
+        Async counterpart of `_request_summary`.
+
+        Args:
+            prompt (str): The full prompt to send.
+            slide_count (int): The number of slides the prompt summarizes. Prompts for
+                               several slides ask the provider for a JSON response.
+
+        Returns:
+            str: The model's response text.
+        """
+        if self.provider == "openai" or self.provider == "groq":
+            response = await self._aclient.chat.completions.create(**self._chat_request(prompt, slide_count))
+            return response.choices[0].message.content.strip()
+
+        elif self.provider == "gemini":
+            model_instance = self._gemini_model(slide_count)
+            response = await model_instance.generate_content_async(prompt, **self._gemini_request(slide_count))
+            return response.text.strip()
+
+        elif self.provider == "vllm":
+            return await self._agenerate_vllm(prompt, slide_count)
+
+    async def _agenerate_vllm(self, prompt, slide_count=1):
+        """
+        Internal helper method generating a summary with the local vLLM engine.
+        Concurrent calls are batched on the GPU by the engine's scheduler.
+
+        Args:
+            prompt (str): The full prompt to send.
+            slide_count (int): The number of slides the prompt summarizes.
+
+        Returns:
+            str: The model's response text.
+        """
+        if self._vllm_tokenizer is None:
+            self._vllm_tokenizer = await self.engine.get_tokenizer()
+        # Render the same system + user messages as the chat APIs with the model's chat template
+        text = self._vllm_tokenizer.apply_chat_template(
+            self._chat_request(prompt, slide_count)["messages"], tokenize=False, add_generation_prompt=True
+        )
+        sampling_params = self._sampling_params(
+            temperature=0.3,
+            max_tokens=self._max_output_tokens(slide_count),
+            stop=self.SUMMARY_STOP_SEQUENCES if slide_count == 1 else None,
+        )
+        final_output = None
+        # generate() streams partial outputs; only the last one holds the full text
+        async for output in self.engine.generate(text, sampling_params, request_id=uuid.uuid4().hex):
+            final_output = output
+        return final_output.outputs[0].text.strip()
+
+    def _chat_request(self, prompt, slide_count=1):
+        """
+        Internal helper method building the chat completions arguments shared by
+        the sync and async OpenAI-compatible clients.
+
+        Args:
+            prompt (str): The full prompt to send.
+            slide_count (int): The number of slides the prompt summarizes. Prompts for
+                               several slides ask for a JSON object response.
+
+        Returns:
+            dict: Keyword arguments for `chat.completions.create`.
+        """
+        request = {
+            "model": self.summary_model,
+            "messages": [
+                {"role": "system", "content": self._system_instruction(slide_count)},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.3, # Lower temperature for more factual, less creative summaries
+            # Cap generation, which dominates request latency; batches get a budget per slide
+            "max_tokens": self._max_output_tokens(slide_count),
+        }
+        if slide_count > 1:
+            request["response_format"] = {"type": "json_object"}
+        else:
+            # Stop sequences would cut a JSON batch response short, so only plain summaries get them
+            request["stop"] = self.SUMMARY_STOP_SEQUENCES
+        return request
+
+    def _gemini_request(self, slide_count=1):
+        """
+        Internal helper method building the extra `generate_content` arguments for Gemini,
+        with the same output limits as `_chat_request`.
+
+        Args:
+            slide_count (int): The number of slides the prompt summarizes. Prompts for
+                               several slides ask for a JSON response.
+
+        Returns:
+            dict: Keyword arguments for `generate_content` / `generate_content_async`.
+        """
+        if slide_count > 1:
+            generation_config = self.client.types.GenerationConfig(
+                max_output_tokens=self._max_output_tokens(slide_count),
+                response_mime_type="application/json",
+            )
+        else:
+            generation_config = self.client.types.GenerationConfig(
+                max_output_tokens=self._max_output_tokens(slide_count),
+                stop_sequences=self.SUMMARY_STOP_SEQUENCES,
+            )
+        return {"generation_config": generation_config}
+
+    def _gemini_model(self, slide_count):
+        """
+        Internal helper method returning the Gemini model for a request, created once
+        per system instruction and reused for all later requests.
+
+        Args:
+            slide_count (int): The number of slides the request summarizes.
+
+        Returns:
+            google.generativeai.GenerativeModel: The model with the matching system instruction.
+        """
+        instruction = self._system_instruction(slide_count)
+        model_instance = self._gemini_models.get(instruction)
+        if model_instance is None:
+            model_instance = self.client.GenerativeModel(self.summary_model, system_instruction=instruction)
+            self._gemini_models[instruction] = model_instance
+        return model_instance
+
+    def _max_output_tokens(self, slide_count):
+        """
+        Internal helper method computing the output token cap of a request.
+
+        Args:
+            slide_count (int): The number of slides the request summarizes.
+
+        Returns:
+            int: `SUMMARY_MAX_TOKENS` per slide, plus room for the JSON wrapper of batches.
+        """
+        if slide_count == 1:
+            return self.SUMMARY_MAX_TOKENS
+        return self.SUMMARY_MAX_TOKENS * slide_count + 10 * slide_count + 20
+
+    def _retry_delay(self, error, attempt):
+        """
+        Internal helper method computing how long to wait before retrying a
+        rate-limited request. Honours the provider's Retry-After header when present,
+        otherwise waits a random time up to an exponentially growing, capped bound.
+
+        Args:
+            error (Exception): The rate-limit exception raised by the client.
+            attempt (int): The 0-based number of the attempt that failed.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after")
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            # "Full jitter" spreads concurrent retries out instead of having them collide again
+            return random.uniform(0, min(self.MAX_BACKOFF_SECONDS, self.BASE_BACKOFF_SECONDS * 2 ** attempt))
+
+    @staticmethod
+    def _is_rate_limit_error(error):
+        """
+        Checks whether an exception raised by an LLM client is a rate-limit (HTTP 429) error.
+
+        Args:
+            error (Exception): The exception raised by the client.
+
+        Returns:
+            bool: True if the request was rejected due to rate limiting.
+        """
+        status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+        return status_code == 429 or type(error).__name__ in ("RateLimitError", "ResourceExhausted")
+
     def summarize_all(self):
         """
         Orchestrates the extraction of text from all PPTX files in the folder
         and summarizes each slide. Optionally saves the summaries to a JSON file.
 
+        When called while an event loop is already running (e.g. from a Jupyter
+        notebook), slides are summarized through the thread pool instead of the
+        async pipeline, still within `requests_per_minute`. The 'vllm' provider has no synchronous API, so it must be
+        run from a script there.
+
         Returns:
             dict: A nested dictionary where keys are filenames and values are lists
                   of summarized strings for each slide in that file.
@@ -174,40 +1160,639 @@ class SlideSummarizer:
                       "presentation2.pptx": ["Summary of slide 1"]
                   }
         """
-        extracted_texts = self.extract_pptx_text()
-        all_summaries = {}
+        # Normalized slide texts already sent (or being sent) in this run, for deduplication
+        self._claims = {}
+        # Summaries already in save_path plus the files finished so far in this run,
+        # written back to save_path as a checkpoint
+        self._completed = self._load_saved_summaries()
+        use_async = self._use_async
+        if use_async and self.provider != "vllm" and _event_loop_running():
+            # asyncio.run cannot start a loop inside a running one (Jupyter); use the thread pool
+            print("ℹ️ An event loop is already running; summarizing through the thread pool instead.")
+            use_async = False
+        if self.mode == "online" and use_async:
+            # Extraction and summarization overlap, so there is nothing to extract up front
+            pptx_paths = iter_pptx_files(self.folder_path)
+            if not pptx_paths:
+                print("❗ No PPTX files found. No summaries to generate.")
+                return {}
+            print(f"\n📝 Extracting and summarizing slides from: {self.folder_path}")
+            all_summaries = self._run_async(self._asummarize_files(pptx_paths))
+        elif self.mode == "batch":
+            # One batch job needs every request up front
+            extracted_texts = self.extract_pptx_text()
+            if not extracted_texts:
+                print("❗ No PPTX files found or no text extracted. No summaries to generate.")
+                return {}
+
+            print("\n📝 Starting slide summarization for all extracted content...")
+            all_summaries = self._summarize_files_batch(extracted_texts)
+        else:
+            all_summaries = {}
+            print("\n📝 Summarizing slides as they are extracted...")
+            # Files are consumed as they are extracted; only the current file's texts are kept.
+            # Iterating per file (not per slide) keeps decks without slides, as the async path does.
+            for filename, slides_text_list in self._iter_extracted():
+                print(f"Processing '{filename}' with {len(slides_text_list)} slides...")
+                file_summaries = self._summarize_file(filename, slides_text_list)
+                all_summaries[filename] = file_summaries
+                print(f"✅ Finished summarizing '{filename}'.")
+                self._checkpoint(filename, file_summaries)
+
+            if not all_summaries:
+                print("❗ No PPTX files found or no text extracted. No summaries to generate.")
+                return all_summaries
 
-        if not extracted_texts:
-            print("❗ No PPTX files found or no text extracted. No summaries to generate.")
-            return all_summaries
+        if self.save_path:
+            # Decks still in the folder that were not summarized again (failed extraction) are kept
+            self._completed.update(all_summaries)
+            self._save_summaries(self._completed)
+
+        return all_summaries
 
-        print("\n📝 Starting slide summarization for all extracted content...")
+    def _summarize_files_batch(self, extracted_texts):
+        """
+        Internal helper method that summarizes all files through the provider's
+        Batch API: every request is written to one JSONL file, uploaded and run
+        as a single asynchronous batch job, and the results are matched back to
+        their slides by `custom_id`. Batch jobs are billed at a discount but may
+        take minutes to hours, so this mode suits offline/bulk runs.
+
+        Args:
+            extracted_texts (dict): Filenames mapped to lists of slide texts.
+
+        Returns:
+            dict: Filenames mapped to lists of slide summaries.
+        """
+        all_summaries = {}
+        jobs = {} # custom_id -> (filename, slide positions covered by the request)
+        request_lines = []
+        duplicates = {} # filename -> positions of duplicate slides mapped to their claims
         for filename, slides_text_list in extracted_texts.items():
-            print(f"Processing '{filename}' with {len(slides_text_list)} slides...")
-            file_summaries = []
-            # Use tqdm for a progress bar during summarization
-            for slide_index, slide_text in enumerate(tqdm(slides_text_list, desc=f"Summarizing {filename}")):
-                summary = self.summarize_slide(slide_text)
-                file_summaries.append(summary)
-            all_summaries[filename] = file_summaries
+            summaries, batches, duplicates[filename] = self._plan_batches(slides_text_list)
+            all_summaries[filename] = summaries
+            # Slides summarized locally were already filled in by _plan_batches
+            for n, positions in enumerate(batches):
+                texts = [slides_text_list[i] for i in positions]
+                if len(texts) == 1:
+                    body = self._chat_request(self._build_prompt(texts[0]))
+                else:
+                    body = self._chat_request(self._build_batch_prompt(texts), len(texts))
+                custom_id = f"{filename}:{n}"
+                jobs[custom_id] = (filename, positions)
+                request_lines.append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": self.BATCH_ENDPOINT,
+                    "body": body,
+                }))
+
+        results = self._run_batch_job(request_lines) if request_lines else {}
+
+        for custom_id, (filename, positions) in jobs.items():
+            slides_text_list = extracted_texts[filename]
+            texts = [slides_text_list[i] for i in positions]
+            content = results.get(custom_id)
+            try:
+                if content is None:
+                    raise ValueError(f"No result for request '{custom_id}'.")
+                summaries = [content] if len(texts) == 1 else self._parse_batch_summaries(content, len(texts))
+            except Exception:
+                # Failed or malformed results are summarized online instead
+                summaries = self.summarize_slides_batch(texts)
+            self._store_batches(slides_text_list, all_summaries[filename], [positions], [summaries])
+
+        for filename, waiting in duplicates.items():
+            self._store_duplicates(extracted_texts[filename], all_summaries[filename], waiting,
+                                   [claim.result() for claim in waiting.values()])
+
+        for filename, file_summaries in all_summaries.items():
             print(f"✅ Finished summarizing '{filename}'.")
+            self._checkpoint(filename, file_summaries)
+        return all_summaries
+
+    def _run_batch_job(self, request_lines):
+        """
+        Internal helper method that uploads the JSONL requests, submits the batch
+        job, polls it until it finishes and downloads its results.
+
+        Args:
+            request_lines (list): One JSON-encoded batch request per element.
+
+        Returns:
+            dict: Response texts keyed by `custom_id`. Requests that failed are omitted.
+        """
+        batch_input = self.client.files.create(
+            file=("slide_summaries.jsonl", "\n".join(request_lines).encode("utf-8")),
+            purpose="batch",
+        )
+        job = self.client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint=self.BATCH_ENDPOINT,
+            completion_window=self.BATCH_COMPLETION_WINDOW,
+        )
+        print(f"📦 Submitted batch job {job.id} with {len(request_lines)} requests.")
+
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(self.BATCH_POLL_SECONDS)
+            job = self.client.batches.retrieve(job.id)
+            counts = job.request_counts
+            done = f" ({counts.completed}/{counts.total})" if counts else ""
+            print(f"⏳ Batch job {job.id} is {job.status}{done}.")
+
+        results = {}
+        # Expired or cancelled jobs may still have partial results
+        if job.output_file_id:
+            output = self.client.files.content(job.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    results[record["custom_id"]] = content.strip()
+        if job.status != "completed" or len(results) < len(request_lines):
+            print(f"⚠️ Batch job {job.id} ended as '{job.status}' with {len(results)} of "
+                  f"{len(request_lines)} results. Summarizing the rest online.")
+        return results
+
+    async def _asummarize_files(self, pptx_paths):
+        """
+        Internal helper method that extracts and summarizes all files through the
+        async client as a pipeline: files are parsed in worker processes, and each
+        file's slides are sent to the LLM as soon as its extraction finishes, while
+        the next files are still being parsed. At most twice as many files as there
+        are workers are extracted or summarized at a time. Slide batches are sent
+        concurrently, with at most `max_workers` requests in flight and the request
+        rate kept under `requests_per_minute`.
+
+        Args:
+            pptx_paths (list): The paths of the .pptx files to summarize.
+
+        Returns:
+            dict: Filenames mapped to lists of slide summaries, in file order.
+        """
+        # Per-run state: these objects are bound to the event loop running this coroutine
+        self._semaphore = asyncio.Semaphore(self._max_in_flight)
+        self._rate_limiter = _AsyncRateLimiter(self.requests_per_minute) if self.requests_per_minute else None
+        loop = asyncio.get_running_loop()
+
+        async def extract_and_summarize(path):
+            try:
+                filename, slides_text_list = await loop.run_in_executor(executor, _extract_one, path)
+            except Exception as e:
+                print(f"❌ Error extracting text from '{os.path.basename(path)}': {e}")
+                return None
+            print(f"✅ Extracted text from '{filename}' ({len(slides_text_list)} slides).")
+            return await self._asummarize_extracted(filename, slides_text_list)
+
+        async with contextlib.AsyncExitStack() as stack:
+            # The async client (if any) is opened per run, since its connection pool is loop-bound
+            self._aclient = None
+            if self._async_client_factory:
+                http_client = await stack.enter_async_context(self._shared_http_client())
+                self._aclient = await stack.enter_async_context(self._async_client_factory(http_client=http_client))
+            # A single thread serializes semantic cache lookups, so the embedding model loads once
+            self._lookup_executor = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+            # None runs small folders on the loop's default thread pool instead of worker processes
+            executor = None
+            workers = min(len(pptx_paths), os.cpu_count() or 1)
+            if len(pptx_paths) >= self.PROCESS_POOL_MIN_FILES:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+
+            # Like `_iter_in_workers`, only a small window of files is in flight: a file holds
+            # its slot from extraction until its summaries are done, bounding memory for large folders
+            files_in_flight = asyncio.Semaphore(2 * max(workers, 1))
+            summarizing = []
+            for path in pptx_paths:
+                await files_in_flight.acquire()
+                task = asyncio.create_task(extract_and_summarize(path))
+                task.add_done_callback(lambda _: files_in_flight.release())
+                summarizing.append(task)
+            file_summaries = dict(result for result in await asyncio.gather(*summarizing) if result is not None)
+
+        # Report files in folder order, whatever order their extraction finished in
+        filenames = (os.path.basename(path) for path in pptx_paths)
+        return {filename: file_summaries[filename] for filename in filenames if filename in file_summaries}
+
+    def _run_async(self, coroutine):
+        """
+        Internal helper method that runs a coroutine to completion, on the summarizer's
+        persistent event loop when it has one (vLLM), or on a fresh one otherwise.
+
+        Args:
+            coroutine (coroutine): The coroutine to run.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If an event loop is already running in this thread (e.g. Jupyter).
+        """
+        if _event_loop_running():
+            coroutine.close()
+            raise RuntimeError(
+                f"The '{self.provider}' provider cannot run inside a running event loop "
+                "(e.g. a Jupyter notebook); run the summarizer from a script instead."
+            )
+        if self._event_loop:
+            return self._event_loop.run_until_complete(coroutine)
+        return asyncio.run(coroutine)
+
+    def _shared_http_client(self):
+        """
+        Internal helper method creating the HTTP client shared by all requests of a run.
+        Keeps up to `max_workers` connections alive so concurrent requests reuse their
+        TLS sessions, and uses HTTP/2 (multiplexing requests over one connection) when
+        the 'h2' package is installed.
+
+        Returns:
+            httpx.AsyncClient: The HTTP client, to be passed to the provider's async client.
+        """
+        import httpx # Installed with the openai and groq SDKs
+
+        return httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=self.max_workers, max_keepalive_connections=self.max_workers),
+            timeout=self.REQUEST_TIMEOUT_SECONDS,
+        )
+
+    async def _asummarize_extracted(self, filename, slides_text_list):
+        """
+        Internal helper method that summarizes one extracted file within the async
+        pipeline and saves the summary cache once it is done.
 
+        Args:
+            filename (str): The name of the PPTX file.
+            slides_text_list (list): The raw text content of each slide.
+
+        Returns:
+            tuple: The filename and its list of slide summaries.
+        """
+        print(f"Processing '{filename}' with {len(slides_text_list)} slides...")
+        file_summaries = await self._asummarize_file(filename, slides_text_list)
+        print(f"✅ Finished summarizing '{filename}'.")
+        self._checkpoint(filename, file_summaries)
+        return filename, file_summaries
+
+    async def _asummarize_file(self, filename, slides_text_list):
+        """
+        Async counterpart of `_summarize_file`. Batches are sent concurrently.
+
+        Args:
+            filename (str): The name of the PPTX file (used for the progress bar).
+            slides_text_list (list): The raw text content of each slide.
+
+        Returns:
+            list: One summary per slide, in slide order.
+        """
+        summaries, batches, waiting = await self._aplan_batches(slides_text_list)
+
+        async def summarize_batch(batch):
+            batch_summaries = await self.asummarize_slides_batch([slides_text_list[i] for i in batch])
+            # Stored as soon as each batch finishes, so a crash loses at most the batches in flight
+            self._store_batches(slides_text_list, summaries, [batch], [batch_summaries])
+
+        # tqdm_asyncio adds a progress bar
+        await tqdm_asyncio.gather(*(summarize_batch(batch) for batch in batches), desc=f"Summarizing {filename}")
+        # Duplicates of slides another file is still summarizing wait for its result
+        duplicate_summaries = [await asyncio.wrap_future(claim) for claim in waiting.values()]
+        self._store_duplicates(slides_text_list, summaries, waiting, duplicate_summaries)
+        return summaries
+
+    def _summarize_file(self, filename, slides_text_list):
+        """
+        Internal helper method that summarizes all slides of one file. Cached
+        summaries are reused for unchanged slide content; the remaining slides
+        are grouped into batches of `batch_size` and summarized concurrently.
+
+        Args:
+            filename (str): The name of the PPTX file (used for the progress bar).
+            slides_text_list (list): The raw text content of each slide.
+
+        Returns:
+            list: One summary per slide, in slide order.
+        """
+        summaries, batches, waiting = self._plan_batches(slides_text_list)
+        # Each request is dominated by network latency, so batches run on a thread pool.
+        # executor.map preserves batch order. Use tqdm for a progress bar.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            batch_summaries = executor.map(
+                self.summarize_slides_batch,
+                ([slides_text_list[i] for i in batch] for batch in batches),
+            )
+            # Store each batch as it arrives, so a crash loses at most the batches in flight
+            # The progress bar is zipped first, so it is exhausted and closes at 100%
+            progress = tqdm(batch_summaries, total=len(batches), desc=f"Summarizing {filename}")
+            for results, batch in zip(progress, batches):
+                self._store_batches(slides_text_list, summaries, [batch], [results])
+        # Files are summarized one after another, so every claim is resolved by now
+        self._store_duplicates(slides_text_list, summaries, waiting, [claim.result() for claim in waiting.values()])
+        return summaries
+
+    def _plan_batches(self, slides_text_list):
+        """
+        Internal helper method that fills in cached and local summaries and groups
+        the remaining slides into batches of at most `batch_size` slides.
+
+        Slides whose normalized text was already claimed earlier in this run (by
+        this file or another one) are not sent again; they wait for the first
+        occurrence's summary instead. The remaining slides are looked up in the
+        semantic cache before being batched.
+
+        Args:
+            slides_text_list (list): The raw text content of each slide.
+
+        Returns:
+            tuple: A list of summaries with only cached and local summaries filled in (others are None),
+                   a list of batches, each a list of slide positions, and a dict mapping
+                   the positions of duplicate slides to the claims they wait on.
+        """
+        summaries, waiting, lookup_positions = self._claim_slides(slides_text_list)
+        similar = self._semantic_lookup([slides_text_list[i] for i in lookup_positions])
+        return self._finish_plan(slides_text_list, summaries, waiting, lookup_positions, similar)
+
+    async def _aplan_batches(self, slides_text_list):
+        """
+        Async counterpart of `_plan_batches`. The semantic cache lookup (embedding
+        model load and encoding) runs on a worker thread, so it does not block the
+        event loop while other files' requests are in flight.
+
+        Args:
+            slides_text_list (list): The raw text content of each slide.
+
+        Returns:
+            tuple: The same values as `_plan_batches`.
+        """
+        summaries, waiting, lookup_positions = self._claim_slides(slides_text_list)
+        similar = await asyncio.get_running_loop().run_in_executor(
+            self._lookup_executor, self._semantic_lookup, [slides_text_list[i] for i in lookup_positions]
+        )
+        return self._finish_plan(slides_text_list, summaries, waiting, lookup_positions, similar)
+
+    def _claim_slides(self, slides_text_list):
+        """
+        Internal helper method for the first planning step: fills in cached and local
+        summaries and claims the remaining slide texts for this run.
+
+        Args:
+            slides_text_list (list): The raw text content of each slide.
+
+        Returns:
+            tuple: The partially filled summaries, the positions of duplicate slides mapped
+                   to the claims they wait on, and the positions to look up in the semantic cache.
+        """
+        summaries = [self.summary_cache.get(self._summary_cache_key(text)) for text in slides_text_list]
+        waiting = {}
+        for i, summary in enumerate(summaries):
+            if summary is not None:
+                continue
+            # Empty, very short and boilerplate slides never reach the LLM
+            summaries[i] = self._local_summary(slides_text_list[i])
+            if summaries[i] is not None:
+                continue
+            key = self._dedup_key(slides_text_list[i])
+            claim = self._claims.get(key)
+            if claim is None:
+                self._claims[key] = Future()
+            else:
+                waiting[i] = claim
+        if waiting:
+            print(f"🔁 Sending {len(waiting)} duplicate slides only once.")
+
+        lookup_positions = []
+        if self.semantic_cache:
+            lookup_positions = [i for i, summary in enumerate(summaries) if summary is None and i not in waiting]
+        return summaries, waiting, lookup_positions
+
+    def _semantic_lookup(self, texts):
+        """
+        Internal helper method looking texts up in the semantic cache. A failing
+        lookup disables the semantic cache for the rest of the run.
+
+        Args:
+            texts (list): The slide texts to look up.
+
+        Returns:
+            list: The similar slides' summaries (or None) per text; empty if there is no cache.
+        """
+        if not self.semantic_cache or not texts:
+            return []
+        try:
+            return self.semantic_cache.lookup(texts)
+        except Exception as e:
+            print(f"⚠️ Semantic cache lookup failed: {e}. Continuing with exact matches only.")
+            self.semantic_cache = None
+            return []
+
+    def _finish_plan(self, slides_text_list, summaries, waiting, lookup_positions, similar):
+        """
+        Internal helper method for the last planning step: applies semantic cache hits
+        and groups the slides still missing a summary into batches.
+
+        Args:
+            slides_text_list (list): The raw text content of each slide.
+            summaries (list): The partially filled summaries, updated in place.
+            waiting (dict): The positions of duplicate slides mapped to their claims.
+            lookup_positions (list): The positions looked up in the semantic cache.
+            similar (list): The lookup results, in `lookup_positions` order.
+
+        Returns:
+            tuple: The same values as `_plan_batches`.
+        """
+        for i, summary in zip(lookup_positions, similar):
+            if summary is not None:
+                summaries[i] = summary
+                # Promote to the exact cache so the next run skips the embedding lookup
+                self.summary_cache[self._summary_cache_key(slides_text_list[i])] = summary
+                self._resolve_claim(slides_text_list[i], summary)
+        if any(summary is not None for summary in similar):
+            print(f"♻️ Reused {sum(summary is not None for summary in similar)} summaries of similar slides.")
+
+        miss_positions = [i for i, summary in enumerate(summaries) if summary is None and i not in waiting]
+        batches = [
+            miss_positions[start:start + self.batch_size]
+            for start in range(0, len(miss_positions), self.batch_size)
+        ]
+        return summaries, batches, waiting
+
+    def _store_batches(self, slides_text_list, summaries, batches, batch_summaries):
+        """
+        Internal helper method that scatters batch results back to their slide
+        positions, adds successful summaries to the summary cache and hands them
+        to any duplicate slides waiting on them. The cache is flushed to disk every
+        `CHECKPOINT_EVERY_SLIDES` new summaries, so long decks are checkpointed too.
+
+        Args:
+            slides_text_list (list): The raw text content of each slide.
+            summaries (list): The per-slide summaries, updated in place.
+            batches (list): The batches of slide positions that were summarized.
+            batch_summaries (list): The summaries returned for each batch.
+        """
+        for batch, results in zip(batches, batch_summaries):
+            for i, summary in zip(batch, results):
+                summaries[i] = summary
+                # Never cache failures, so they are retried on the next run
+                if not summary.startswith("[Error"):
+                    self.summary_cache[self._summary_cache_key(slides_text_list[i])] = summary
+                    if self.semantic_cache:
+                        self.semantic_cache.add(slides_text_list[i], summary)
+                    self._unsaved_summaries += 1
+                self._resolve_claim(slides_text_list[i], summary)
+        if self._unsaved_summaries >= self.CHECKPOINT_EVERY_SLIDES:
+            self._save_summary_cache()
+
+    def _store_duplicates(self, slides_text_list, summaries, waiting, duplicate_summaries):
+        """
+        Internal helper method that fills in the summaries of duplicate slides.
+
+        Args:
+            slides_text_list (list): The raw text content of each slide.
+            summaries (list): The per-slide summaries, updated in place.
+            waiting (dict): The positions of duplicate slides mapped to their claims.
+            duplicate_summaries (list): The resolved summary of each claim, in `waiting` order.
+        """
+        for i, summary in zip(waiting, duplicate_summaries):
+            summaries[i] = summary
+            # The text may differ from the first occurrence in case or spacing
+            if not summary.startswith("[Error"):
+                self.summary_cache[self._summary_cache_key(slides_text_list[i])] = summary
+
+    def _resolve_claim(self, slide_text, summary):
+        """
+        Internal helper method that hands a slide's summary to the duplicates waiting on it.
+        Failed claims are released, so a later occurrence of the text is sent again.
+
+        Args:
+            slide_text (str): The raw text of the summarized slide.
+            summary (str): Its summary (or error message).
+        """
+        key = self._dedup_key(slide_text)
+        claim = self._claims.get(key)
+        if claim is None or claim.done():
+            return
+        claim.set_result(summary)
+        if summary.startswith("[Error"):
+            del self._claims[key]
+
+    @staticmethod
+    def _dedup_key(slide_text):
+        """
+        Builds the key under which identical slides are summarized only once per run.
+        Case and whitespace differences are ignored.
+
+        Args:
+            slide_text (str): The raw text content of a single slide.
+
+        Returns:
+            bytes: The digest of the normalized slide text.
+        """
+        return content_key(" ".join(slide_text.lower().split()))
+
+    def _summary_cache_key(self, slide_text):
+        """
+        Builds the summary cache key for a slide's text content.
+
+        Args:
+            slide_text (str): The raw text content of a single slide.
+
+        Returns:
+            str: The hex digest of the model name and slide text.
+        """
+        return content_key(self.summary_model, slide_text).hex()
+
+    def _load_summary_cache(self):
+        """
+        Internal helper method to load the summary cache from disk.
+
+        Returns:
+            dict: A mapping of slide content hashes to summaries. Empty if no cache
+                  is configured, the file does not exist, or it cannot be read.
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            cache = _read_json(self.cache_path)
+            print(f"🗂️ Loaded {len(cache)} cached summaries from: {self.cache_path}")
+            return cache
+        except Exception as e:
+            print(f"⚠️ Could not read summary cache '{self.cache_path}': {e}. Starting with an empty cache.")
+            return {}
+
+    def _save_summary_cache(self):
+        """
+        Internal helper method to atomically persist the summary cache to disk.
+        Writes to a temporary file first so a crash never leaves a partial cache.
+        The semantic cache, if any, is saved alongside it.
+        """
+        self._unsaved_summaries = 0
+        if self.semantic_cache:
+            self.semantic_cache.save()
+        if not self.cache_path:
+            return
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            _write_json_atomic(self.cache_path, self.summary_cache)
+        except Exception as e:
+            print(f"❌ Error saving summary cache to '{self.cache_path}': {e}")
+
+    def _checkpoint(self, filename, file_summaries):
+        """
+        Internal helper method called after each finished file. Flushes the summary
+        cache and rewrites `save_path` with the files finished so far, merged into
+        its previous contents for decks still in the folder, so an interrupted run
+        keeps its output and the next run only summarizes what is missing (finished
+        slides are summary cache hits).
+
+        Args:
+            filename (str): The name of the finished PPTX file.
+            file_summaries (list): Its slide summaries.
+        """
+        self._completed[filename] = file_summaries
+        self._save_summary_cache()
         if self.save_path:
-            self._save_summaries(all_summaries)
+            self._save_summaries(self._completed, quiet=True)
 
-        return all_summaries
+    def _load_saved_summaries(self):
+        """
+        Internal helper method to load the summaries already written to `save_path`,
+        so checkpoints and the final save add to them instead of replacing them.
+        Only decks still in the folder are kept: a deck that fails to extract in this
+        run keeps its earlier summaries, while deleted or renamed decks are dropped so
+        the search corpus built from `save_path` never points at missing files.
 
-    def _save_summaries(self, summaries):
+        Returns:
+            dict: Filenames mapped to lists of slide summaries. Empty if no save path
+                  is configured, the file does not exist, or it cannot be read.
         """
-        Internal helper method to save the generated summaries to a JSON file.
+        if not self.save_path or not os.path.exists(self.save_path):
+            return {}
+        try:
+            summaries = _read_json(self.save_path)
+            if isinstance(summaries, dict):
+                present = {os.path.basename(path) for path in iter_pptx_files(self.folder_path)}
+                return {filename: summaries[filename] for filename in summaries if filename in present}
+            print(f"⚠️ Ignoring '{self.save_path}': expected a JSON object of summaries.")
+        except Exception as e:
+            print(f"⚠️ Could not read saved summaries '{self.save_path}': {e}. They will be overwritten.")
+        return {}
+
+    def _save_summaries(self, summaries, quiet=False):
+        """
+        Internal helper method to atomically save the generated summaries to a JSON file.
+        Writes to a temporary file first so a crash never leaves a partial file.
 
         Args:
             summaries (dict): The dictionary of summaries to save.
+            quiet (bool): Whether to skip the success message (used for checkpoints).
         """
         try:
-            with open(self.save_path, "w", encoding="utf-8") as f:
-                json.dump(summaries, f, indent=4)
-            print(f"💾 Successfully saved all summaries to: {self.save_path}")
+            _write_json_atomic(self.save_path, summaries)
+            if not quiet:
+                print(f"💾 Successfully saved all summaries to: {self.save_path}")
         except IOError as e:
             print(f"❌ Error saving summaries to '{self.save_path}': {e}")
         except Exception as e:
@@ -221,7 +1806,15 @@ class SlideSummarizer:
 
         Args:
             img (PIL.Image.Image): The image to display.
+
+        Raises:
+            ImportError: If matplotlib is not installed.
         """
+        try:
+            import matplotlib.pyplot as plt # Only needed for displaying images
+        except ImportError as e:
+            raise ImportError("Displaying images requires matplotlib: pip install matplotlib") from e
+
         plt.figure(figsize=(10, 7)) # Adjust figure size as needed
         plt.imshow(img)
         plt.axis('off') # Hide axes for cleaner image presentation